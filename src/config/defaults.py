@@ -57,6 +57,9 @@ def get_default_config() -> dict[str, Any]:
                 "max_size": 15,
                 "command_timeout": 30.0,
                 "timeout": 60.0,
+                "max_inactive_connection_lifetime": 300.0,
+                "max_queries": 50000,
+                "statement_cache_size": 1024,
             },
             # Retry policy for transient database errors
             "retry": {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 import re
@@ -49,20 +50,22 @@ class ConfigLoader:
         This is the main public method, as described in Step 2 of the plan.
         """
         # Step 1: Read and prepare raw data (Plan Step 3.1)
-        if not os.path.exists(self.config_path):
+        # Open directly instead of checking os.path.exists first: one syscall,
+        # and no window for the file to vanish between the check and the open.
+        try:
+            with open(self.config_path, encoding="utf-8") as f:
+                # fmt: off
+                user_config_raw = cast(dict[str, Any], self.yaml.load(f) or {})  # pyright: ignore[reportUnknownMemberType]
+                # fmt: on
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found at '{self.config_path}'."
-            )
+            ) from None
 
         # Load environment variables from a .env file if it exists.
         if load_dotenv():
             logger.info("Loaded environment variables from .env file.")
 
-        with open(self.config_path, encoding="utf-8") as f:
-            # fmt: off
-            user_config_raw = cast(dict[str, Any], self.yaml.load(f) or {})  # pyright: ignore[reportUnknownMemberType]
-            # fmt: on
-
         # Step 2: Resolve environment variables (Plan Step 3.2)
         user_config_resolved = self._resolve_env_vars(user_config_raw)
 
@@ -124,6 +127,13 @@ class ConfigLoader:
         # Start with the absolute base defaults from schemas (via get_default_config)
         base_config = get_default_config()
 
+        # Keep an untouched copy of the generic provider template. The merge
+        # below mutates base_config in place, and each provider instance needs
+        # its own fresh copy of the template to merge into.
+        provider_template = copy.deepcopy(
+            base_config["providers"]["llm_provider_default"]
+        )
+
         # Merge user's global settings over the base defaults.
         # This uses the 'always_merger' from the deepmerge library, as planned.
         final_config = always_merger.merge(base_config, user_config)
@@ -140,8 +150,8 @@ class ConfigLoader:
                     f"Provider '{name}' must have a 'provider_type' defined in the configuration."
                 )
 
-            # 1. Start with the generic provider template from defaults.py
-            provider_base = get_default_config()["providers"]["llm_provider_default"]
+            # 1. Start with a fresh copy of the generic provider template
+            provider_base = copy.deepcopy(provider_template)
 
             # 2. Merge the user's specific configuration for this instance.
             # Since we have removed automatic template injection (provider_templates.py),
@@ -659,6 +659,16 @@ class DatabasePoolConfig(BaseModel):
     # Maximum time (seconds) to wait for a TCP connection to the database.
     # Default is 60s (matching asyncpg's built-in default).
     timeout: float = Field(default=60.0, gt=0)
+    # Seconds after which an idle pooled connection is closed. 0 disables the
+    # idle reaper. Default 300s (asyncpg's built-in default).
+    max_inactive_connection_lifetime: float = Field(default=300.0, ge=0)
+    # Number of queries after which a pooled connection is recycled.
+    # Default 50000 (asyncpg's built-in default).
+    max_queries: int = Field(default=50000, gt=0)
+    # Per-connection prepared statement LRU size. The keeper and gateway issue
+    # a small set of hot parameterised queries, so a larger cache than
+    # asyncpg's default (100) avoids re-preparing them. 0 disables the cache.
+    statement_cache_size: int = Field(default=1024, ge=0)
 
     @model_validator(mode="after")
     def check_bounds(self) -> "DatabasePoolConfig":
@@ -1,5 +1,6 @@
 # src/core/accessor.py
 
+from functools import cached_property
 
 # This import structure assumes that the application is run from the root
 # directory and 'src' is in the Python path, as configured in main.py.
@@ -77,15 +78,27 @@ class ConfigAccessor:
         """Returns a dictionary of all configured provider instances."""
         return self._config.providers
 
+    @cached_property
+    def _enabled_providers(self) -> dict[str, ProviderConfig]:
+        """Snapshot of enabled providers, built on first use.
+
+        The config is immutable for the lifetime of an accessor (a reload
+        creates a new ``ConfigAccessor``), so the filter only needs to run once.
+        """
+        return {
+            name: conf for name, conf in self._config.providers.items() if conf.enabled
+        }
+
     def get_enabled_providers(self) -> dict[str, ProviderConfig]:
         """
         Returns a dictionary of only the enabled provider instances.
         This is a key improvement for convenience, as most services will only
         care about active providers.
+
+        The returned dictionary is cached and shared between callers; it must
+        be treated as read-only.
         """
-        return {
-            name: conf for name, conf in self._config.providers.items() if conf.enabled
-        }
+        return self._enabled_providers
 
     def get_provider(self, name: str) -> ProviderConfig | None:
         """
@@ -26,12 +26,16 @@ class HttpClientFactory:
     """
 
     # REFACTORED: The constructor now accepts ConfigAccessor for dependency injection.
-    def __init__(self, accessor: ConfigAccessor):
+    def __init__(self, accessor: ConfigAccessor, min_keepalive_expiry: float = 0.0):
         """
         Initializes the HttpClientFactory.
 
         Args:
             accessor: An instance of ConfigAccessor to safely access configuration values.
+            min_keepalive_expiry: Lower bound applied to
+                ``http_client.pool.keepalive_expiry`` for every client this
+                factory creates, so periodic callers (the keeper's probes) can
+                reuse connections across cycles.
         """
         self.accessor: ConfigAccessor = accessor
         self.logger: logging.Logger = logging.getLogger(__name__)
@@ -40,6 +44,15 @@ class HttpClientFactory:
         http_config = accessor.get_http_client_config()
         self._http2_enabled: bool = http_config.http2
         self._pool_config = http_config.pool
+        self._keepalive_expiry: float = max(
+            http_config.pool.keepalive_expiry, min_keepalive_expiry
+        )
+        if self._keepalive_expiry > http_config.pool.keepalive_expiry:
+            self.logger.info(
+                f"Raising http_client.pool.keepalive_expiry from "
+                f"{http_config.pool.keepalive_expiry}s to {self._keepalive_expiry}s "
+                f"for this factory's clients."
+            )
         self._pool_health_log_interval_sec: int = (
             http_config.pool_health_log_interval_sec
         )
@@ -137,7 +150,7 @@ class HttpClientFactory:
                 limits = httpx.Limits(
                     max_connections=self._pool_config.max_connections,
                     max_keepalive_connections=self._pool_config.max_keepalive_connections,
-                    keepalive_expiry=self._pool_config.keepalive_expiry,
+                    keepalive_expiry=self._keepalive_expiry,
                 )
                 provider_config = self.accessor.get_provider(provider_name)
                 transport = CapacityAwareHttp2Transport(
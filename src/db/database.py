@@ -6,7 +6,7 @@ import asyncio
 import logging
 import random
 from datetime import UTC, datetime
-from typing import Any, TypedDict
+from typing import TypedDict
 
 import asyncpg
 from asyncpg import Pool
@@ -113,6 +113,24 @@ CREATE INDEX IF NOT EXISTS idx_key_status_next_check_time ON key_model_status(ne
 CREATE INDEX IF NOT EXISTS idx_key_status_gateway_lookup ON key_model_status(status, model_name);
 """
 
+# Built once at import instead of formatting the WHERE clause on every
+# probe result.
+_UPDATE_STATUS_QUERY = """
+    UPDATE key_model_status
+    SET
+        status = $1,
+        last_checked = NOW() AT TIME ZONE 'utc',
+        next_check_time = $2,
+        status_code = $3,
+        response_time = $4,
+        error_message = $5,
+        failing_since = CASE
+            WHEN $6 THEN NULL
+            ELSE COALESCE(failing_since, NOW() AT TIME ZONE 'utc')
+        END
+    WHERE key_id = $7 AND model_name = $8
+"""
+
 # --- Component 1: Connection Management ---
 
 
@@ -122,6 +140,9 @@ async def init_db_pool(
     max_size: int = 15,
     command_timeout: float = 30.0,
     timeout: float = 60.0,
+    max_inactive_connection_lifetime: float = 300.0,
+    max_queries: int = 50000,
+    statement_cache_size: int = 1024,
 ) -> None:
     """
     Initializes an async connection pool to PostgreSQL.
@@ -132,6 +153,11 @@ async def init_db_pool(
         max_size: Maximum pool size (default 15).
         command_timeout: Maximum time in seconds for a single query (default 30).
         timeout: Maximum time in seconds for TCP connection (default 60).
+        max_inactive_connection_lifetime: Seconds before an idle connection
+            is closed (default 300).
+        max_queries: Queries after which a connection is recycled (default 50000).
+        statement_cache_size: Prepared statement cache size per connection
+            (default 1024).
 
     Raises:
         Exception: If pool initialization fails.
@@ -147,6 +173,9 @@ async def init_db_pool(
             max_size=max_size,
             command_timeout=command_timeout,
             timeout=timeout,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            max_queries=max_queries,
+            statement_cache_size=statement_cache_size,
         )
         logger.info("Database connection pool initialized successfully.")
     except Exception as e:
@@ -190,6 +219,10 @@ class ProviderRepository:
     def __init__(self, pool: Pool, key_purger: IKeyPurger):
         self._pool = pool
         self._key_purger = key_purger
+        # Provider name -> id map, refreshed by ``sync()``.  Provider rows only
+        # change when the configuration is synced, so every sync cycle can
+        # serve the map from memory instead of querying the table again.
+        self._id_map_cache: dict[str, int] | None = None
 
     async def sync(
         self,
@@ -200,6 +233,7 @@ class ProviderRepository:
 
         Uses ``KeyPurger.purge_provider()`` for deletion so that the purge
         can emit metrics and follow the same code path as scheduled purges.
+        The resulting name-to-id map is cached for ``get_id_map()``.
         """
         async with self._pool.acquire() as conn, conn.transaction():
             rows = await conn.fetch("SELECT name, id FROM providers")
@@ -235,12 +269,26 @@ class ProviderRepository:
                         provider_id,
                         deleted,
                     )
+                    del providers_in_db[name]
+
+            if new_providers:
+                # COPY does not return generated ids, so re-read the table.
+                rows = await conn.fetch("SELECT name, id FROM providers")
+                providers_in_db = {row["name"]: row["id"] for row in rows}
+
+        self._id_map_cache = providers_in_db
 
     async def get_id_map(self) -> dict[str, int]:
-        """Fetches a mapping of all provider names to their database IDs."""
-        async with self._pool.acquire() as conn:
-            rows = await conn.fetch("SELECT id, name FROM providers")
-            return {row["name"]: row["id"] for row in rows}
+        """Returns a mapping of all provider names to their database IDs.
+
+        Served from the map cached by ``sync()``; the table is only queried
+        when no sync has run yet.  Returns a copy the caller may mutate.
+        """
+        if self._id_map_cache is None:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch("SELECT id, name FROM providers")
+                self._id_map_cache = {row["name"]: row["id"] for row in rows}
+        return dict(self._id_map_cache)
 
 
 class KeyRepository:
@@ -339,30 +387,21 @@ class KeyRepository:
             # Remove obsolete model associations.
             models_to_remove = list(current_model_state - desired_model_state)
             if models_to_remove:
-                # --- MODIFIED BLOCK START ---
-                # The previous method using UNNEST($1::record[]) is not supported by asyncpg's default codecs.
-                # This new approach dynamically builds a WHERE clause with simple parameters, which is universally compatible.
-                # This is safe from SQL injection because we only generate the structure and use parameterized inputs.
-
-                conditions: list[str] = []
-                flat_params: list[Any] = []
-                param_idx = 1
-                for key_id, model_name in models_to_remove:
-                    # For each pair to remove, create a condition like: (key_id = $1 AND model_name = $2)
-                    conditions.append(
-                        f"(key_id = ${param_idx} AND model_name = ${param_idx + 1})"
+                # Pass the pairs as two parallel typed arrays: one fixed statement
+                # removes any number of rows in a single round-trip and stays in
+                # the prepared statement cache, unlike a generated OR chain
+                # (UNNEST($1::record[]) is not supported by asyncpg's codecs).
+                key_ids, model_names = zip(*models_to_remove, strict=True)
+                await conn.execute(
+                    """
+                    DELETE FROM key_model_status
+                    WHERE (key_id, model_name) IN (
+                        SELECT * FROM UNNEST($1::int[], $2::text[])
                     )
-                    # Add the actual values to a flat list for parameter substitution.
-                    flat_params.extend([key_id, model_name])
-                    param_idx += 2
-
-                # Join all conditions with OR to form the final WHERE clause.
-                where_clause = " OR ".join(conditions)
-                query = f"DELETE FROM key_model_status WHERE {where_clause}"
-
-                # Execute the dynamically built, fully parameterized query.
-                await conn.execute(query, *flat_params)
-                # --- MODIFIED BLOCK END ---
+                    """,
+                    list(key_ids),
+                    list(model_names),
+                )
                 logger.info(
                     f"SYNC '{provider_name}': Removed {len(models_to_remove)} obsolete key-model associations."
                 )
@@ -439,34 +478,17 @@ class KeyRepository:
         ), f"Attempted to write invalid status '{status_str}' to the database!"
 
         async with self._pool.acquire() as conn, conn.transaction():
-            base_query = """
-                UPDATE key_model_status
-                SET
-                    status = $1,
-                    last_checked = NOW() AT TIME ZONE 'utc',
-                    next_check_time = $2,
-                    status_code = $3,
-                    response_time = $4,
-                    error_message = $5,
-                    failing_since = CASE
-                        WHEN $6 THEN NULL
-                        ELSE COALESCE(failing_since, NOW() AT TIME ZONE 'utc')
-                    END
-                WHERE {where_clause}
-                """
-
-            params = [
+            await conn.execute(
+                _UPDATE_STATUS_QUERY,
                 status_str,
                 next_check_time,
                 result.status_code,
                 result.response_time,
                 result.message[:1000],
                 result.ok,
-            ]
-
-            where_clause = "key_id = $7 AND model_name = $8"
-            params.extend([key_id, ALL_MODELS_MARKER])
-            await conn.execute(base_query.format(where_clause=where_clause), *params)
+                key_id,
+                ALL_MODELS_MARKER,
+            )
 
     async def get_available_key(
         self, provider_name: str, model_name: str
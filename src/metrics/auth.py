@@ -7,6 +7,8 @@ with no dependencies on FastAPI, HTTPException, or any web framework.
 
 from __future__ import annotations
 
+import hmac
+
 from src.core.accessor import ConfigAccessor
 
 
@@ -61,5 +63,6 @@ def validate_metrics_token(raw_token: str | None, expected: str) -> None:
     if not raw_token:
         raise MetricsAuthError(401, "Missing or invalid Authorization header")
 
-    if raw_token != expected:
+    # Constant-time comparison so response timing does not leak a token prefix.
+    if not hmac.compare_digest(raw_token.encode(), expected.encode()):
         raise MetricsAuthError(403, "Invalid metrics access token")
@@ -21,6 +21,15 @@ class GatewayCache:
     database calls in the hot path.
     """
 
+    # Fixed attribute layout: no per-instance __dict__ on the request hot path.
+    __slots__ = (
+        "accessor",
+        "db_manager",
+        "_auth_token_map",
+        "_key_pool",
+        "_refresh_lock",
+    )
+
     def __init__(self, accessor: ConfigAccessor, db_manager: DatabaseManager):
         """
         Initializes the GatewayCache with necessary dependencies.
@@ -101,16 +110,19 @@ class GatewayCache:
                 # 3. Atomically replace the old pool with the new one.
                 self._key_pool = new_key_pool
 
-                total_keys = sum(len(q) for q in self._key_pool.values())
-                logger.debug(
-                    f"Key pool cache refreshed successfully. Loaded {total_keys} keys across {len(self._key_pool)} pools."
-                )
-
             except Exception as e:
                 logger.critical(
                     "Failed to refresh key pool cache due to a database error.",
                     exc_info=e,
                 )
+                return
+
+        # Summarize outside the lock so pending removals are not held up by
+        # the count and log formatting.
+        total_keys = sum(len(q) for q in new_key_pool.values())
+        logger.debug(
+            f"Key pool cache refreshed successfully. Loaded {total_keys} keys across {len(new_key_pool)} pools."
+        )
 
     async def populate_caches(self) -> None:
         """
@@ -200,14 +212,17 @@ class GatewayCache:
 
         initial_size = len(key_queue)
 
-        # Re-create the deque, excluding the key with the matching ID.
-        new_queue = collections.deque([info for info in key_queue if info[0] != key_id])
+        # Remove matching entries in place instead of re-creating the deque.
+        # There is normally at most one, so deque.remove() (a C-level scan)
+        # avoids copying every other entry of the pool on the failure path.
+        stale = [info for info in key_queue if info[0] == key_id]
+        for info in stale:
+            key_queue.remove(info)
 
-        if len(new_queue) < initial_size:
-            self._key_pool[pool_key] = new_queue
+        if stale:
             logger.debug(
                 f"Removed failed key_id {key_id} from live cache pool '{pool_key}'. "
-                f"Pool size changed from {initial_size} to {len(new_queue)}."
+                f"Pool size changed from {initial_size} to {len(key_queue)}."
             )
         else:
             # This is not an error, just means the key was already removed by another coroutine.
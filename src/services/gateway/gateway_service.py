@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import re
+from collections.abc import Coroutine
 from contextlib import asynccontextmanager
 from typing import Annotated, Any
 
@@ -75,6 +76,27 @@ app_state: dict[str, Any] = {
     "cache_refresh_task": None,
 }
 
+# Upper bound on in-flight fast-feedback DB reports (see _schedule_key_failure).
+MAX_PENDING_FAILURE_TASKS = 10_000
+# How long shutdown waits for in-flight failure reports before closing the pool.
+FAILURE_TASK_DRAIN_TIMEOUT_SEC = 5.0
+
+# Strong references to in-flight failure-report and pool-removal tasks.
+_pending_failure_tasks: set[asyncio.Task[None]] = set()
+# The in-flight DB report per (key_id, error reason); concurrent failures of
+# one key with the same reason share it.
+_key_report_tasks: dict[tuple[int, ErrorReason], asyncio.Task[None]] = {}
+
+# Matches JSON string fields whose values must be masked in debug logs.
+# Compiled once here rather than on every _sanitize_body call.
+_SENSITIVE_JSON_FIELD_RE = re.compile(
+    r'("api[_-]?key"|"token"|"secret"|"password")\s*:\s*"[^"]*"', re.IGNORECASE
+)
+
+# Non-UTF-8 bodies are logged via repr(), which can expand each byte up to 4x.
+# Only this many leading bytes are rendered.
+MAX_BINARY_DEBUG_BYTES = 2048
+
 # --- Helper Functions ---
 
 
@@ -130,11 +152,8 @@ def _sanitize_body(body: bytes, provider_type: str | None = None) -> str:
                             # Parse JSON to validate, re-serialize, and apply regex
                             parsed = json.loads(json_str)
                             serialized = json.dumps(parsed)
-                            redacted = re.sub(
-                                r'("api[_-]?key"|"token"|"secret"|"password")\s*:\s*"[^"]*"',
-                                r'\1: "***"',
-                                serialized,
-                                flags=re.IGNORECASE,
+                            redacted = _SENSITIVE_JSON_FIELD_RE.sub(
+                                r'\1: "***"', serialized
                             )
                             line = f"data: {redacted}"
                         except (json.JSONDecodeError, TypeError):
@@ -148,17 +167,17 @@ def _sanitize_body(body: bytes, provider_type: str | None = None) -> str:
         if decoded_str.strip().startswith(("{", "[")):
             # Simple regex-based redaction for common sensitive keys
             # This is a best-effort approach and may not catch all cases.
-            redacted_str = re.sub(
-                r'("api[_-]?key"|"token"|"secret"|"password")\s*:\s*"[^"]*"',
-                r'\1: "***"',
-                decoded_str,
-                flags=re.IGNORECASE,
-            )
+            redacted_str = _SENSITIVE_JSON_FIELD_RE.sub(r'\1: "***"', decoded_str)
             return redacted_str
         else:
             return decoded_str
     except (UnicodeDecodeError, json.JSONDecodeError):
         # If it's not valid UTF-8 or not JSON, use repr to show a safe representation
+        if len(body) > MAX_BINARY_DEBUG_BYTES:
+            return (
+                f"{body[:MAX_BINARY_DEBUG_BYTES]!r}... "
+                f"[truncated, {len(body)} bytes total]"
+            )
         return repr(body)
 
 
@@ -237,7 +256,7 @@ class StreamMonitor:
 
     async def __anext__(self):
         if self.start_time is None:
-            self.start_time = asyncio.get_event_loop().time()
+            self.start_time = asyncio.get_running_loop().time()
         # Track whether this call ends the stream (exception/completion)
         # vs. returns a chunk normally (stream continues). On normal chunk
         # return, finally must NOT finalize — the stream is still active.
@@ -274,7 +293,7 @@ class StreamMonitor:
         if self.start_time is None:
             return  # The stream never started
 
-        duration = asyncio.get_event_loop().time() - self.start_time
+        duration = asyncio.get_running_loop().time() - self.start_time
         formatted_model = self._format_model_name()
         internal_status = self._get_internal_status()
         http_status = f"{self.upstream_response.status_code} {self.upstream_response.reason_phrase}"
@@ -399,16 +418,85 @@ async def _report_key_failure(
         )
 
 
+def _schedule_key_failure(
+    db_manager: DatabaseManager,
+    cache: GatewayCache,
+    accessor: ConfigAccessor,
+    key_id: int,
+    provider_name: str,
+    result: CheckResult,
+) -> None:
+    """
+    Schedules the fast-feedback DB report and the live pool removal for a failed key.
+
+    The event loop only keeps weak references to tasks, so both are held in
+    ``_pending_failure_tasks`` until they finish and are drained on shutdown.
+    Requests that fail on the same key for the same reason while its report
+    is still in flight coalesce into that one write; a different reason is
+    reported on its own, so e.g. an INVALID_KEY after a RATE_LIMITED still
+    gets its longer quarantine. Under a failure storm, DB reports beyond
+    ``MAX_PENDING_FAILURE_TASKS`` are dropped with a warning; the pool removal
+    is always scheduled.
+    """
+    report_key = (key_id, result.error_reason)
+    in_flight = _key_report_tasks.get(report_key)
+    if in_flight is not None and not in_flight.done():
+        logger.debug(
+            f"Fast feedback: {result.error_reason.value} report for key_id {key_id} "
+            f"already in flight; coalescing."
+        )
+    elif len(_pending_failure_tasks) < MAX_PENDING_FAILURE_TASKS:
+        report_task = _track_failure_task(
+            _report_key_failure(db_manager, key_id, provider_name, result, accessor)
+        )
+        _key_report_tasks[report_key] = report_task
+        report_task.add_done_callback(
+            lambda task: _release_key_report(report_key, task)
+        )
+    else:
+        logger.warning(
+            f"Fast feedback: {len(_pending_failure_tasks)} failure tasks pending. "
+            f"Dropping the DB report for key_id {key_id}; the keeper will re-check it."
+        )
+    _track_failure_task(cache.remove_key_from_pool(provider_name, key_id))
+
+
+def _track_failure_task(coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+    """Starts a background task and keeps a strong reference until it is done."""
+    task = asyncio.create_task(coro)
+    _pending_failure_tasks.add(task)
+    task.add_done_callback(_pending_failure_tasks.discard)
+    return task
+
+
+def _release_key_report(
+    report_key: tuple[int, ErrorReason], task: asyncio.Task[None]
+) -> None:
+    """Forgets a finished report unless a newer one has replaced it."""
+    if _key_report_tasks.get(report_key) is task:
+        del _key_report_tasks[report_key]
+
+
 async def _cache_refresh_loop(cache: GatewayCache, interval_sec: int) -> None:
     """
     An infinite loop that periodically refreshes the key pool cache.
+
+    Runs at a fixed rate against the event loop's monotonic clock, so a slow
+    refresh shortens the next sleep instead of delaying every later refresh.
     """
     logger.info(
         f"Starting cache refresh loop with an interval of {interval_sec} seconds."
     )
+    loop = asyncio.get_running_loop()
+    next_run = loop.time() + interval_sec
     while True:
         try:
-            await asyncio.sleep(interval_sec)
+            await asyncio.sleep(max(0.0, next_run - loop.time()))
+            next_run += interval_sec
+            # More than two intervals behind: resync instead of running
+            # back-to-back refreshes to catch up.
+            if loop.time() - next_run > interval_sec:
+                next_run = loop.time() + interval_sec
             await cache.refresh_key_pool()
         except asyncio.CancelledError:
             logger.info("Cache refresh loop is shutting down.")
@@ -497,7 +585,8 @@ def _get_token_from_headers(
     1. Checks for 'Authorization: Bearer <token>'.
     2. Falls back to 'x-goog-api-key: <token>'.
     """
-    if authorization and authorization.lower().startswith("bearer "):
+    # Lower-case only the 7-char scheme prefix, not the whole header value.
+    if authorization and authorization[:7].lower() == "bearer ":
         return authorization.split(" ", 1)[1]
     return x_goog_api_key
 
@@ -526,12 +615,13 @@ async def _handle_full_stream_request(
 
     key_id, api_key = key_info
     client = await http_factory.get_client_for_provider(instance_name)
+    request_headers = dict(request.headers)
 
     upstream_response, check_result, body_bytes = await provider.proxy_request(
         client=client,
         token=api_key,
         method=request.method,
-        headers=dict(request.headers),
+        headers=request_headers,
         path=request.url.path,
         query_params=str(request.url.query),
         content=request.stream(),
@@ -578,7 +668,7 @@ async def _handle_full_stream_request(
                 instance_name=instance_name,
                 request_method=request.method,
                 request_path=str(request.url),
-                request_headers=dict(request.headers),
+                request_headers=request_headers,
                 request_body=b"",  # We don't have the original request body in full stream mode
                 response_status=upstream_response.status_code,
                 response_headers=dict(upstream_response.headers),
@@ -586,12 +676,9 @@ async def _handle_full_stream_request(
             )
 
         # Report and remove the failed key from the live cache.
-        asyncio.create_task(
-            _report_key_failure(
-                db_manager, key_id, instance_name, check_result, accessor
-            )
+        _schedule_key_failure(
+            db_manager, cache, accessor, key_id, instance_name, check_result
         )
-        asyncio.create_task(cache.remove_key_from_pool(instance_name, key_id))
         return await forward_error_to_client(
             upstream_response, check_result, body_bytes
         )
@@ -615,6 +702,11 @@ async def _handle_buffered_retryable_request(
     server_error_policy = retry_policy.on_server_error
 
     request_body = await request.body()
+    # Materialize the headers once; every retry attempt reuses the same dict.
+    request_headers = dict(request.headers)
+    effective_debug_mode: str = request.app.state.debug_mode_map.get(
+        instance_name, "disabled"
+    )
     try:
         _ = await provider.parse_request_details(
             path=request.url.path, content=request_body
@@ -665,7 +757,7 @@ async def _handle_buffered_retryable_request(
                         client=client,
                         token=api_key,
                         method=request.method,
-                        headers=dict(request.headers),
+                        headers=request_headers,
                         path=request.url.path,
                         query_params=str(request.url.query),
                         content=request_body,
@@ -675,10 +767,6 @@ async def _handle_buffered_retryable_request(
 
                 if check_result.ok:
                     # Case 1: Success. Check if debug logging is needed.
-                    effective_debug_mode = request.app.state.debug_mode_map.get(
-                        instance_name, "disabled"
-                    )
-
                     if effective_debug_mode != "disabled":
                         _response_handled = True
                         return await forward_buffered_body(
@@ -716,9 +804,6 @@ async def _handle_buffered_retryable_request(
                     logger.error(
                         f"Non-retryable client error received: {reason.value}. Aborting retry cycle."
                     )
-                    effective_debug_mode = request.app.state.debug_mode_map.get(
-                        instance_name, "disabled"
-                    )
                     if effective_debug_mode != "disabled":
                         _response_handled = True
                         return await forward_buffered_body(
@@ -740,17 +825,8 @@ async def _handle_buffered_retryable_request(
                         f"Marking key_id {key_id} as failed and removing from pool."
                     )
 
-                    asyncio.create_task(
-                        _report_key_failure(
-                            db_manager,
-                            key_id,
-                            instance_name,
-                            check_result,
-                            accessor,
-                        )
-                    )
-                    asyncio.create_task(
-                        cache.remove_key_from_pool(instance_name, key_id)
+                    _schedule_key_failure(
+                        db_manager, cache, accessor, key_id, instance_name, check_result
                     )
 
                     key_error_attempts += 1
@@ -802,17 +878,13 @@ async def _handle_buffered_retryable_request(
                         failed_key_ids.add(key_id)
 
                         # Treat exhaustion as a key failure: Penalize and Rotate
-                        asyncio.create_task(
-                            _report_key_failure(
-                                db_manager,
-                                key_id,
-                                instance_name,
-                                check_result,
-                                accessor,
-                            )
-                        )
-                        asyncio.create_task(
-                            cache.remove_key_from_pool(instance_name, key_id)
+                        _schedule_key_failure(
+                            db_manager,
+                            cache,
+                            accessor,
+                            key_id,
+                            instance_name,
+                            check_result,
                         )
 
                         # Fall through to Key Rotation logic
@@ -950,6 +1022,9 @@ def create_app(accessor: ConfigAccessor) -> FastAPI:
                 max_size=pool_cfg.max_size,
                 command_timeout=pool_cfg.command_timeout,
                 timeout=pool_cfg.timeout,
+                max_inactive_connection_lifetime=pool_cfg.max_inactive_connection_lifetime,
+                max_queries=pool_cfg.max_queries,
+                statement_cache_size=pool_cfg.statement_cache_size,
             )
 
             # Wait for the Worker to finish initializing the database schema.
@@ -999,6 +1074,11 @@ def create_app(accessor: ConfigAccessor) -> FastAPI:
             task.cancel()
         if health_task := getattr(app.state, "pool_health_task", None):
             health_task.cancel()
+        if _pending_failure_tasks:
+            # Let in-flight failure reports reach the DB before the pool closes.
+            await asyncio.wait(
+                set(_pending_failure_tasks), timeout=FAILURE_TASK_DRAIN_TIMEOUT_SEC
+            )
         if http_factory := getattr(app.state, "http_client_factory", None):
             await http_factory.close_all()
         await database.close_db_pool()
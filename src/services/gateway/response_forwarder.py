@@ -60,12 +60,13 @@ def _extract_filtered_headers(response: httpx.Response) -> dict[str, str]:
     """Remove hop-by-hop headers from the upstream response.
 
     Returns a plain ``dict`` of headers that are safe to forward to the
-    client.
+    client.  ``httpx.Headers.items()`` already yields lower-cased names, so
+    they are checked against the frozenset without a per-header ``lower()``.
     """
     return {
         key: value
         for key, value in response.headers.items()
-        if key.lower() not in _HOP_BY_HOP_HEADERS
+        if key not in _HOP_BY_HOP_HEADERS
     }
 
 
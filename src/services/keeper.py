@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import os
-from collections.abc import Callable
+import signal
+from collections.abc import Callable, Coroutine, Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
 import asyncpg
@@ -33,9 +35,15 @@ from src.services.key_purger import KeyPurger
 from src.services.synchronizers import get_all_syncers
 from src.services.synchronizers.key_sync import read_keys_from_directory
 
+logger = logging.getLogger(__name__)
+
 # The path is now defined in one place and passed to the loader.
 CONFIG_PATH = "config/providers.yaml"
 
+# Idle-connection lifetime for the keeper's HTTP clients: one probe interval
+# plus jitter, so each cycle finds the previous cycle's connections still open.
+PROBE_KEEPALIVE_EXPIRY_SEC = 90.0
+
 
 def _add_scheduler_job(
     scheduler: AsyncIOScheduler,
@@ -49,52 +57,80 @@ def _add_scheduler_job(
     # fmt: on
 
 
-def _setup_directories(accessor: ConfigAccessor) -> None:
+def _mkdir_batch(paths: Iterable[str]) -> None:
+    """
+    Creates every directory in ``paths`` in one pass (run via ``asyncio.to_thread``).
+
+    Paths are processed deepest-first and any path that is an ancestor of one
+    already ensured is skipped, since it must exist as well.  Each remaining
+    path costs a single ``os.mkdir``; ``os.makedirs`` is only used when a
+    parent directory is missing.
+    """
+    created: set[str] = set()
+    for path in sorted(
+        filter(None, paths), key=lambda p: p.count(os.sep), reverse=True
+    ):
+        if path in created:
+            continue
+        # One mkdir per path: it either creates the leaf or reports that it
+        # exists (the common warm-restart case).  Only a missing parent falls
+        # back to makedirs, which walks and creates the intermediate levels.
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            # Only an existing directory is fine; a regular file in its place
+            # is the same error os.makedirs(exist_ok=True) would raise.
+            if not os.path.isdir(path):
+                raise
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
+        logger.debug(f"Directory ensured: '{path}'")
+        parent = path
+        while parent and parent not in created:
+            created.add(parent)
+            parent = os.path.dirname(parent)
+
+
+async def _setup_directories(accessor: ConfigAccessor) -> None:
     """
     Ensures that all necessary directories specified in the config exist.
     Creates them if they don't, using the ConfigAccessor.
     """
-    logger = logging.getLogger(__name__)
     logger.info("Checking and setting up required directories...")
 
-    paths_to_check: set[str] = set()
-
-    for provider_name, provider in accessor.get_all_providers().items():
-        if provider.enabled:
-            key_path = os.path.join("data", provider_name, "raw")
-            paths_to_check.add(key_path)
+    enabled_providers = accessor.get_enabled_providers()
+    paths_to_check = frozenset(
+        os.path.join("data", provider_name, "raw")
+        for provider_name in enabled_providers
+    )
 
     try:
-        for path in paths_to_check:
-            if path:
-                os.makedirs(path, exist_ok=True)
-                logger.debug(f"Directory ensured: '{path}'")
+        # Issue all stat+mkdir syscalls from a single worker thread so startup
+        # does not block the event loop once per provider.
+        await asyncio.to_thread(_mkdir_batch, paths_to_check)
 
         # Warn if any enabled provider's key directory has no key files
-        for provider_name, provider in accessor.get_all_providers().items():
-            if provider.enabled:
-                key_path = os.path.join("data", provider_name, "raw")
-                if os.path.isdir(key_path):
-                    entries = os.listdir(key_path)
-                    has_keys = any(
-                        os.path.isfile(os.path.join(key_path, e))
-                        and os.path.splitext(e)[1].lower() in (".txt", ".ndjson")
-                        for e in entries
+        for provider_name in enabled_providers:
+            key_path = os.path.join("data", provider_name, "raw")
+            if os.path.isdir(key_path):
+                entries = os.listdir(key_path)
+                has_keys = any(
+                    os.path.isfile(os.path.join(key_path, e))
+                    and os.path.splitext(e)[1].lower() in (".txt", ".ndjson")
+                    for e in entries
+                )
+                if not has_keys:
+                    logger.warning(
+                        f"No key files (.txt/.ndjson) found in '{key_path}'. "
+                        f"Please place API keys in this directory."
                     )
-                    if not has_keys:
-                        logger.warning(
-                            f"No key files (.txt/.ndjson) found in '{key_path}'. "
-                            f"Please place API keys in this directory."
-                        )
 
         logger.info("Directory setup complete.")
 
         # --- Startup cleanup: remove leftover .trash/ directories ---
         # After a crash, raw key files may have been moved to .trash/ but not
         # yet unlinked. Clean those up now so they don't accumulate.
-        for provider_name, provider in accessor.get_all_providers().items():
-            if not provider.enabled:
-                continue
+        for provider_name in enabled_providers:
             trash_dir = os.path.join("data", provider_name, "raw", ".trash")
             if os.path.isdir(trash_dir):
                 try:
@@ -134,7 +170,6 @@ async def run_sync_cycle(
     Orchestrates a single, two-phase synchronization cycle.
     This function centralizes the synchronization logic, making it more robust and readable.
     """
-    logger = logging.getLogger(__name__)
     logger.debug("Starting new TWO-PHASE synchronization cycle...")
 
     try:
@@ -143,20 +178,33 @@ async def run_sync_cycle(
         logger.debug(
             "Sync Phase 1 (Read): Collecting desired state from files and config..."
         )
-        desired_state: dict[str, dict[str, Any]] = {
-            "keys": {},
-        }
-
         enabled_providers = accessor.get_enabled_providers()
-        for provider_name in enabled_providers:
-            # For KeySyncer (always runs for enabled providers)
-            key_path = os.path.join("data", provider_name, "raw")
-            keys_from_file, file_map = read_keys_from_directory(key_path)
-            key_state: ProviderKeyState = {
-                "keys_from_files": keys_from_file,
-                "file_map": file_map,
-            }
-            desired_state["keys"][provider_name] = key_state
+        provider_names = list(enabled_providers)
+
+        # Directory scans are blocking syscalls: dispatch each provider's read
+        # to a worker thread and gather them so the walks overlap instead of
+        # stalling the event loop one after another. The provider ID lookup
+        # needed by Phase 2 only depends on the database, so it is issued
+        # alongside the reads rather than after them.
+        provider_id_map, key_results = await asyncio.gather(
+            db_manager.providers.get_id_map(),
+            asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        read_keys_from_directory, os.path.join("data", name, "raw")
+                    )
+                    for name in provider_names
+                )
+            ),
+        )
+        # KeySyncer always runs for enabled providers.
+        key_states: dict[str, ProviderKeyState] = {
+            provider_name: {"keys_from_files": keys_from_file, "file_map": file_map}
+            for provider_name, (keys_from_file, file_map) in zip(
+                provider_names, key_results, strict=True
+            )
+        }
+        desired_state: dict[str, dict[str, Any]] = {"keys": key_states}
 
         logger.debug(
             f"Sync Phase 1 (Read) complete. Collected state for {len(enabled_providers)} providers."
@@ -168,20 +216,32 @@ async def run_sync_cycle(
             "Sync Phase 2 (Apply): Applying collected state to the database..."
         )
 
-        provider_id_map = await db_manager.providers.get_id_map()
-
         # Polymorphically call the 'apply_state' method on each syncer.
+        # Syncers touch independent tables, so they are applied concurrently;
+        # return_exceptions keeps one failing syncer from aborting the others.
+        syncer_names: list[str] = []
+        apply_coros: list[Coroutine[Any, Any, None]] = []
         for syncer in all_syncers:
             syncer_name = syncer.__class__.__name__
             try:
                 # Get the specific part of the desired state that this syncer is responsible for.
                 resource_type = syncer.get_resource_type()
                 state_for_syncer = desired_state[resource_type]
-                await syncer.apply_state(provider_id_map, state_for_syncer)
             except Exception as e:
                 logger.error(
                     f"Error during apply phase for {syncer_name}: {e}", exc_info=True
                 )
+                continue
+            syncer_names.append(syncer_name)
+            apply_coros.append(syncer.apply_state(provider_id_map, state_for_syncer))
+
+        results = await asyncio.gather(*apply_coros, return_exceptions=True)
+        for syncer_name, result in zip(syncer_names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error during apply phase for {syncer_name}: {result}",
+                    exc_info=result,
+                )
 
         logger.debug("Sync Phase 2 (Apply) complete. Database state is consistent.")
 
@@ -281,7 +341,6 @@ async def _collect_db_metrics_loop(
 
     Runs inside the Keeper's asyncio event loop.
     """
-    logger = logging.getLogger(__name__)
     while True:
         try:
             collector = get_collector()
@@ -293,6 +352,30 @@ async def _collect_db_metrics_loop(
         await asyncio.sleep(interval_sec)
 
 
+async def _wait_for_shutdown_signal() -> None:
+    """
+    Blocks until SIGTERM or SIGINT is delivered to the process.
+
+    Waiting on an event instead of a sleep loop lets shutdown start as soon as
+    the signal arrives.  Where the loop cannot install signal handlers (e.g.
+    Windows), SIGINT still surfaces as ``KeyboardInterrupt``.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    installed: list[signal.Signals] = []
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            continue
+        installed.append(sig)
+    try:
+        await stop_event.wait()
+    finally:
+        for sig in installed:
+            loop.remove_signal_handler(sig)
+
+
 async def run_keeper() -> None:
     """
     The main async function for the keeper service.
@@ -300,11 +383,13 @@ async def run_keeper() -> None:
     """
     scheduler = None
     logger: logging.Logger | None = None
+    accessor: ConfigAccessor | None = None
     client_factory: HttpClientFactory | None = None
 
     try:
         # Step 1: Load Configuration and create the Accessor.
-        config = load_config(CONFIG_PATH)
+        # YAML parsing and validation are blocking; keep them off the loop.
+        config = await asyncio.to_thread(load_config, CONFIG_PATH)
         accessor = ConfigAccessor(config)
 
         # Step 2: Setup Centralized Logging.
@@ -313,24 +398,37 @@ async def run_keeper() -> None:
 
         logger.info("--- Starting LLM Gateway Keeper (Async) ---")
 
-        # Step 3: Setup Directories.
-        _setup_directories(accessor)
-
-        # Step 4: Initialize and Verify Database Connection.
+        # Steps 3 & 4: Setup Directories and Initialize the Database Pool.
+        # The two are independent, so the filesystem work overlaps the pool's
+        # connection handshakes.  Both are awaited to completion before the
+        # first error (if any) is raised, so no half-started init outlives us.
         dsn = accessor.get_database_dsn()
         pool_cfg = accessor.get_pool_config()
-        await database.init_db_pool(
-            dsn,
-            min_size=pool_cfg.min_size,
-            max_size=pool_cfg.max_size,
-            command_timeout=pool_cfg.command_timeout,
-            timeout=pool_cfg.timeout,
-        )
+        for result in await asyncio.gather(
+            _setup_directories(accessor),
+            database.init_db_pool(
+                dsn,
+                min_size=pool_cfg.min_size,
+                max_size=pool_cfg.max_size,
+                command_timeout=pool_cfg.command_timeout,
+                timeout=pool_cfg.timeout,
+                max_inactive_connection_lifetime=pool_cfg.max_inactive_connection_lifetime,
+                max_queries=pool_cfg.max_queries,
+                statement_cache_size=pool_cfg.statement_cache_size,
+            ),
+            return_exceptions=True,
+        ):
+            if isinstance(result, BaseException):
+                raise result
         db_manager = DatabaseManager()
         await db_manager.initialize_schema()
 
         # Step 5: Create Long-Lived Client Factory.
-        client_factory = HttpClientFactory(accessor)
+        # Probes run once a minute, so keep idle connections open across
+        # cycles instead of re-doing TCP/TLS handshakes on every run.
+        client_factory = HttpClientFactory(
+            accessor, min_keepalive_expiry=PROBE_KEEPALIVE_EXPIRY_SEC
+        )
         logger.info("Long-lived HttpClientFactory created.")
 
         # --- Initialize the metrics collector (single-process mode) ---
@@ -367,10 +465,25 @@ async def run_keeper() -> None:
         # Step 8: Scheduler Setup.
         scheduler = AsyncIOScheduler(timezone="UTC")
 
+        # Stagger the first run of each probe and add jitter to every interval
+        # job so they do not all hit the connection pool in the same second.
+        probe_start = datetime.now(UTC) + timedelta(minutes=1)
         for i, probe in enumerate(all_probes):
             job_id = f"{probe.__class__.__name__}_cycle_{i}"
             _add_scheduler_job(
-                scheduler, probe.run_cycle, "interval", minutes=1, id=job_id
+                scheduler,
+                probe.run_cycle,
+                "interval",
+                minutes=1,
+                jitter=15,
+                start_date=probe_start + timedelta(seconds=i * 2),
+                id=job_id,
+                # A cycle that overruns collapses any backlog into one run, and
+                # a run delayed by a busy loop still starts instead of being
+                # dropped by APScheduler's default 1-second grace period.
+                coalesce=True,
+                max_instances=1,
+                misfire_grace_time=30,
             )
 
         # REFACTORED: Instead of scheduling each syncer, schedule the central cycle function.
@@ -379,7 +492,11 @@ async def run_keeper() -> None:
             run_sync_cycle,
             "interval",
             minutes=5,
+            jitter=60,
             id="two_phase_sync_cycle",
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=120,
             args=[
                 accessor,
                 db_manager,
@@ -450,26 +567,35 @@ async def run_keeper() -> None:
         # Step 9: Start Scheduler and Run Indefinitely
         scheduler.start()
 
-        # This loop keeps the main coroutine alive.
-        while True:
-            await asyncio.sleep(3600)
+        # Keep the main coroutine alive until SIGTERM/SIGINT arrives.
+        await _wait_for_shutdown_signal()
+        logger.info("Shutdown signal received.")
 
     except (KeyboardInterrupt, SystemExit):
         if logger:
             logger.info("Shutdown signal received.")
-    except asyncpg.exceptions.InvalidPasswordError:
+    except asyncpg.exceptions.InvalidPasswordError as e:
         # Error logging for specific, common setup problems.
-        db_conf = ConfigAccessor(load_config(CONFIG_PATH)).get_database_config()
-        print(
-            f"[CRITICAL] Database authentication failed for user '{db_conf.user}'. "
-            f"Please verify credentials in your .env file."
-        )
+        # The accessor from Step 1 is reused; the config is never re-parsed here.
+        if accessor is None:
+            print(f"[CRITICAL] Database authentication failed: {e}")
+        else:
+            db_conf = accessor.get_database_config()
+            print(
+                f"[CRITICAL] Database authentication failed for user '{db_conf.user}'. "
+                f"Please verify credentials in your .env file."
+            )
     except (ConnectionRefusedError, OSError) as e:
-        db_conf = ConfigAccessor(load_config(CONFIG_PATH)).get_database_config()
-        print(
-            f"[CRITICAL] Could not connect to the database at {db_conf.host}:{db_conf.port}. "
-            f"Error: {e}. Please ensure the database server is running and accessible."
-        )
+        if accessor is None:
+            print(
+                f"[CRITICAL] An OS error occurred before the configuration was loaded: {e}"
+            )
+        else:
+            db_conf = accessor.get_database_config()
+            print(
+                f"[CRITICAL] Could not connect to the database at {db_conf.host}:{db_conf.port}. "
+                f"Error: {e}. Please ensure the database server is running and accessible."
+            )
     except Exception as e:
         if logger:
             logger.critical(
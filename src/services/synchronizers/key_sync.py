@@ -16,6 +16,18 @@ from src.db.database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Key files are read in one call through a 32 KiB buffer so that directories
+# with many small files cost one or two read() syscalls per file.
+_KEY_FILE_BUFFER_SIZE = 32 * 1024
+
+# Result of the last complete read of each key directory, keyed by path.  The
+# signature holds ``(name, st_mtime_ns, st_size)`` for every key file, so a
+# directory whose files are unchanged is answered from one scandir plus one
+# stat per file instead of re-reading and re-parsing every file.
+_directory_cache: dict[
+    str, tuple[frozenset[tuple[str, int, int]], frozenset[str], dict[str, float]]
+] = {}
+
 
 def read_keys_from_directory(path: str) -> tuple[set[str], dict[str, float]]:
     """
@@ -29,6 +41,8 @@ def read_keys_from_directory(path: str) -> tuple[set[str], dict[str, float]]:
 
     Files with other extensions (``.gitkeep``, ``.DS_Store``, files without
     extension) are silently ignored. The original files are never modified.
+    If no key file's name, mtime or size changed since the last successful
+    read of ``path``, the previous result is returned without reading files.
 
     NDJSON parsing:
       - Empty lines are silently skipped.
@@ -47,51 +61,74 @@ def read_keys_from_directory(path: str) -> tuple[set[str], dict[str, float]]:
         *before* the file was read.  Returns ``(set(), {})`` if the directory
         does not exist or contains no valid key files.
     """
-    if not os.path.exists(path) or not os.path.isdir(path):
+    all_keys: set[str] = set()
+    file_map: dict[str, float] = {}
+    try:
+        # scandir yields the entry type from the directory listing itself, so
+        # regular files are recognised without a separate stat per entry.
+        with os.scandir(path) as it:
+            entries = [entry for entry in it if entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         logger.warning(
             f"Key directory not found or is not a directory: '{path}'. Skipping."
         )
         return set(), {}
-
-    all_keys: set[str] = set()
-    file_map: dict[str, float] = {}
-    try:
-        for filename in os.listdir(path):
-            filepath = os.path.join(path, filename)
-            if not os.path.isfile(filepath):
-                continue
-
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in (".txt", ".ndjson"):
-                logger.debug(f"Skipping non-key file: '{filename}'")
-                continue
-
-            # Capture mtime BEFORE reading to detect modifications during sync.
-            try:
-                stat = os.stat(filepath)
-            except FileNotFoundError:
-                continue  # Race: file deleted between listdir and stat
-            file_map[os.path.abspath(filepath)] = stat.st_mtime
-
-            try:
-                if ext == ".txt":
-                    _read_txt_file(filepath, all_keys)
-                elif ext == ".ndjson":
-                    _read_ndjson_file(filepath, all_keys)
-            except Exception as e:
-                logger.error(
-                    f"Failed to read or parse key file '{filepath}': {e}",
-                    exc_info=True,
-                )
     except Exception as e:
         logger.error(f"Failed to list files in directory '{path}': {e}", exc_info=True)
+        return set(), {}
 
-    return all_keys, file_map
+    key_files: list[tuple[str, str]] = []
+    signature: set[tuple[str, int, int]] = set()
+    read_failed = False
+    for entry in entries:
+        ext = os.path.splitext(entry.name)[1].lower()
+        if ext not in (".txt", ".ndjson"):
+            logger.debug(f"Skipping non-key file: '{entry.name}'")
+            continue
+
+        # Capture mtime BEFORE reading to detect modifications during sync.
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue  # Race: file deleted between scandir and stat
+        except OSError as e:
+            read_failed = True
+            logger.error(f"Failed to stat key file '{entry.path}': {e}")
+            continue
+        file_map[os.path.abspath(entry.path)] = stat.st_mtime
+        signature.add((entry.name, stat.st_mtime_ns, stat.st_size))
+        key_files.append((entry.path, ext))
+
+    frozen_signature = frozenset(signature)
+    cached = _directory_cache.get(path)
+    if not read_failed and cached is not None and cached[0] == frozen_signature:
+        logger.debug(f"Key files in '{path}' unchanged since last read.")
+        return set(cached[1]), dict(cached[2])
+
+    for filepath, ext in key_files:
+        try:
+            if ext == ".txt":
+                _read_txt_file(filepath, all_keys)
+            else:
+                _read_ndjson_file(filepath, all_keys)
+        except Exception as e:
+            read_failed = True
+            logger.error(
+                f"Failed to read or parse key file '{filepath}': {e}",
+                exc_info=True,
+            )
+
+    # A failed read is retried on the next call rather than cached.
+    if read_failed:
+        _directory_cache.pop(path, None)
+    else:
+        _directory_cache[path] = (frozen_signature, frozenset(all_keys), file_map)
+    return all_keys, dict(file_map)
 
 
 def _read_txt_file(filepath: str, all_keys: set[str]) -> None:
     """Read a plain text key file and add keys to ``all_keys``."""
-    with open(filepath, encoding="utf-8") as f:
+    with open(filepath, encoding="utf-8", buffering=_KEY_FILE_BUFFER_SIZE) as f:
         content = f.read()
     keys_in_file = re.split(r"[\s,]+", content)
     cleaned_keys = {key for key in keys_in_file if key}
@@ -99,53 +136,51 @@ def _read_txt_file(filepath: str, all_keys: set[str]) -> None:
 
 
 def _read_ndjson_file(filepath: str, all_keys: set[str]) -> None:
-    """Read an NDJSON key file line‑by‑line and add keys to ``all_keys``."""
-    with open(filepath, encoding="utf-8-sig") as f:
-        for line_num, line in enumerate(f, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue  # empty line → skip silently
-
-            try:
-                obj: Any = json.loads(stripped)
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"Skipping non-JSON line {line_num} in '{filepath}': {stripped!r}"
-                )
-                continue
-
-            if not isinstance(obj, dict):
-                logger.warning(
-                    f"Skipping non-dict JSON line {line_num} in '{filepath}'"
-                )
-                continue
-
-            if "value" not in obj:
-                logger.warning(
-                    f"Skipping JSON without 'value' field at line {line_num} "
-                    f"in '{filepath}': {obj}"
-                )
-                continue
-
-            # fmt: off
-            raw_value: str | int | float | None = obj["value"]  # pyright: ignore[reportUnknownVariableType]
-            # fmt: on
-            if raw_value is None:
-                logger.warning(
-                    f"Skipping null 'value' at line {line_num} in '{filepath}'"
-                )
-                continue
+    """Read an NDJSON key file and add keys to ``all_keys`` line‑by‑line."""
+    with open(filepath, encoding="utf-8-sig", buffering=_KEY_FILE_BUFFER_SIZE) as f:
+        content = f.read()
 
-            if isinstance(raw_value, str):
-                all_keys.add(raw_value)
-            else:
-                logger.warning(
-                    f"Coercing non-string 'value' ({type(raw_value).__name__}) "  # pyright: ignore[reportUnknownArgumentType]
-                    f"to str at line {line_num} in '{filepath}'"
-                )
-                all_keys.add(
-                    str(raw_value)  # pyright: ignore[reportUnknownArgumentType]
-                )
+    # Text mode already normalised newlines to "\n"; splitting on it (rather
+    # than str.splitlines) matches the line boundaries of iterating the file.
+    for line_num, line in enumerate(content.split("\n"), start=1):
+        stripped = line.strip()
+        if not stripped:
+            continue  # empty line → skip silently
+
+        try:
+            obj: Any = json.loads(stripped)
+        except json.JSONDecodeError:
+            logger.warning(
+                f"Skipping non-JSON line {line_num} in '{filepath}': {stripped!r}"
+            )
+            continue
+
+        if not isinstance(obj, dict):
+            logger.warning(f"Skipping non-dict JSON line {line_num} in '{filepath}'")
+            continue
+
+        if "value" not in obj:
+            logger.warning(
+                f"Skipping JSON without 'value' field at line {line_num} "
+                f"in '{filepath}': {obj}"
+            )
+            continue
+
+        # fmt: off
+        raw_value: str | int | float | None = obj["value"]  # pyright: ignore[reportUnknownVariableType]
+        # fmt: on
+        if raw_value is None:
+            logger.warning(f"Skipping null 'value' at line {line_num} in '{filepath}'")
+            continue
+
+        if isinstance(raw_value, str):
+            all_keys.add(raw_value)
+        else:
+            logger.warning(
+                f"Coercing non-string 'value' ({type(raw_value).__name__}) "  # pyright: ignore[reportUnknownArgumentType]
+                f"to str at line {line_num} in '{filepath}'"
+            )
+            all_keys.add(str(raw_value))  # pyright: ignore[reportUnknownArgumentType]
 
 
 class KeySyncer(IResourceSyncer):
@@ -181,6 +216,11 @@ class KeySyncer(IResourceSyncer):
         """
         Performs a full synchronization for API keys by applying the desired state to the database.
 
+        Each provider is committed in its own transaction (inside
+        ``KeyRepository.sync``) before its raw files are cleaned up, so a
+        file is never deleted while the keys read from it are uncommitted,
+        and one failing provider does not roll back the others.
+
         Args:
             provider_id_map: A mapping from provider name to its database ID.
             desired_key_state: A dictionary where keys are provider names and values
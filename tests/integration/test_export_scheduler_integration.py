@@ -127,7 +127,7 @@ async def test_scheduler_registers_snapshot_and_inventory_jobs():
             "src.services.keeper.AsyncIOScheduler",
         ) as mock_scheduler_cls,
         patch(
-            "asyncio.sleep",
+            "src.services.keeper._wait_for_shutdown_signal",
             new_callable=AsyncMock,
             side_effect=KeyboardInterrupt,
         ),
@@ -153,7 +153,7 @@ async def test_scheduler_registers_snapshot_and_inventory_jobs():
         mock_scheduler_instance.print_jobs = MagicMock()
         mock_scheduler_cls.return_value = mock_scheduler_instance
 
-        # Run the keeper (KeyboardInterrupt breaks the infinite loop)
+        # Run the keeper (KeyboardInterrupt stands in for the shutdown signal)
         await run_keeper()
 
         # Inspect all add_job calls recorded on the mock scheduler
@@ -225,7 +225,7 @@ async def test_scheduler_no_jobs_when_export_disabled():
             "src.services.keeper.AsyncIOScheduler",
         ) as mock_scheduler_cls,
         patch(
-            "asyncio.sleep",
+            "src.services.keeper._wait_for_shutdown_signal",
             new_callable=AsyncMock,
             side_effect=KeyboardInterrupt,
         ),
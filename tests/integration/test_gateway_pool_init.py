@@ -95,4 +95,7 @@ async def test_gateway_pool_init_custom_params():
             max_size=10,
             command_timeout=30.0,
             timeout=60.0,
+            max_inactive_connection_lifetime=300.0,
+            max_queries=50000,
+            statement_cache_size=1024,
         )
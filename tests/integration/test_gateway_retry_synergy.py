@@ -291,5 +291,59 @@ async def test_counter_reset_on_key_rotation_unchanged():
     assert response.body == b'{"error": "invalid key2"}'
 
 
+@pytest.mark.asyncio
+async def test_retry_attempts_reuse_one_request_headers_dict():
+    """
+    Scenario: one transient server error followed by an exhausted retry.
+    Every attempt must receive the same materialized request headers dict
+    rather than re-copying request.headers per attempt.
+    """
+    from src.services.gateway.gateway_service import _handle_buffered_retryable_request
+
+    req = make_mock_request()
+    provider = MagicMock()
+    provider.parse_request_details = AsyncMock()
+
+    provider_config = ProviderConfig(provider_type="openai_like")
+    provider_config.gateway_policy.retry.enabled = True
+    provider_config.gateway_policy.retry.on_server_error = RetryOnErrorConfig(
+        attempts=2, backoff_sec=0.1
+    )
+    provider_config.gateway_policy.retry.on_key_error = RetryOnErrorConfig(
+        attempts=1, backoff_sec=0.1
+    )
+    req.app.state.accessor.get_provider_or_raise.return_value = provider_config
+    req.app.state.gateway_cache.get_key_from_pool.return_value = (1, "key1")
+
+    response_server_error = MagicMock()
+    response_server_error.status_code = 500
+    response_server_error.headers = {}
+    response_server_error.aclose = AsyncMock()
+    response_server_error.aread = AsyncMock(return_value=b'{"error": "boom"}')
+    server_error = CheckResult.fail(ErrorReason.SERVER_ERROR, "Server error")
+    provider.proxy_request = AsyncMock(
+        return_value=(response_server_error, server_error, None)
+    )
+
+    original_sleep = asyncio.sleep
+
+    async def mock_sleep(delay):
+        await original_sleep(0)
+
+    with (
+        patch("asyncio.sleep", side_effect=mock_sleep),
+        patch("src.services.gateway.gateway_service.discard_response", AsyncMock()),
+    ):
+        await _handle_buffered_retryable_request(req, provider, "test-provider")
+        await asyncio.sleep(0.01)
+
+    assert provider.proxy_request.call_count == 2
+    first_headers, second_headers = (
+        call.kwargs["headers"] for call in provider.proxy_request.call_args_list
+    )
+    assert first_headers is second_headers
+    assert first_headers == {"authorization": "Bearer test-token"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
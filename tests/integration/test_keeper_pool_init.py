@@ -80,9 +80,9 @@ async def test_keeper_pool_init_default_params():
         patch(
             "src.services.keeper.AsyncIOScheduler",
         ) as mock_scheduler_cls,
-        # Make asyncio.sleep raise KeyboardInterrupt to break the infinite loop
+        # Simulate a shutdown signal as soon as the keeper starts waiting
         patch(
-            "asyncio.sleep",
+            "src.services.keeper._wait_for_shutdown_signal",
             new_callable=AsyncMock,
             side_effect=KeyboardInterrupt,
         ),
@@ -118,4 +118,7 @@ async def test_keeper_pool_init_default_params():
             max_size=15,
             command_timeout=30.0,
             timeout=60.0,
+            max_inactive_connection_lifetime=300.0,
+            max_queries=50000,
+            statement_cache_size=1024,
         )
@@ -240,7 +240,7 @@ async def test_startup_trash_cleanup_then_normal_sync(tmp_path):
 
     # Phase 1 — Startup cleanup via _setup_directories
     with patch("os.path.join", join_patch):
-        _setup_directories(accessor)
+        await _setup_directories(accessor)
 
     # .trash/ cleaned at startup
     assert not trash.exists()
@@ -59,6 +59,13 @@ class TestDatabasePoolConfigDefaults:
         pool = DatabasePoolConfig()
         assert pool.timeout == 60.0
 
+    def test_connection_lifecycle_defaults(self):
+        """DatabasePoolConfig() → idle lifetime 300s, 50000 queries, cache 1024."""
+        pool = DatabasePoolConfig()
+        assert pool.max_inactive_connection_lifetime == 300.0
+        assert pool.max_queries == 50000
+        assert pool.statement_cache_size == 1024
+
 
 # ==============================================================================
 # UT-P03, UT-P05, UT-P06: Validation errors
@@ -140,6 +147,18 @@ class TestDatabasePoolConfigValidation:
         pool = DatabasePoolConfig(timeout=30.0)
         assert pool.timeout == 30.0
 
+    def test_max_queries_zero_rejected(self):
+        """DatabasePoolConfig(max_queries=0) → raises ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            DatabasePoolConfig(max_queries=0)
+
+        assert "max_queries" in str(exc_info.value)
+
+    def test_statement_cache_size_zero_accepted(self):
+        """DatabasePoolConfig(statement_cache_size=0) → valid (disables the cache)."""
+        pool = DatabasePoolConfig(statement_cache_size=0)
+        assert pool.statement_cache_size == 0
+
 
 # ==============================================================================
 # UT-P07: Integration with root Config
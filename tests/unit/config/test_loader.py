@@ -58,14 +58,14 @@ providers:
         assert provider.api_base_url == "https://api.test.com/v1"
 
 
-def test_config_loader_file_not_found():
+def test_config_loader_file_not_found(tmp_path):
     """
     Test that ConfigLoader.load() raises FileNotFoundError when the file does not exist.
     """
-    with patch("os.path.exists", return_value=False):
-        loader = ConfigLoader(path="nonexistent.yaml")
-        with pytest.raises(FileNotFoundError):
-            loader.load()
+    missing = str(tmp_path / "nonexistent.yaml")
+    loader = ConfigLoader(path=missing)
+    with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+        loader.load()
 
 
 def test_config_loader_invalid_yaml():
@@ -212,3 +212,30 @@ providers:
         assert adaptive.min_batch_delay_sec == 3.0
         assert adaptive.max_batch_delay_sec == 120.0
         assert adaptive.failure_rate_threshold == 0.3
+
+
+def test_build_and_merge_config_builds_defaults_once_per_load():
+    """
+    Test that _build_and_merge_config builds the default config once and gives
+    every provider its own copy of the provider template.
+    """
+    from src.config.defaults import get_default_config
+
+    user_config = {
+        "providers": {
+            "first": {"provider_type": "gemini", "default_model": {"a": {}}},
+            "second": {"provider_type": "gemini"},
+        }
+    }
+
+    with patch(
+        "src.config.loader.get_default_config", side_effect=get_default_config
+    ) as mock_defaults:
+        merged = ConfigLoader(path="unused.yaml")._build_and_merge_config(user_config)
+
+    mock_defaults.assert_called_once()
+    first = merged["providers"]["first"]
+    second = merged["providers"]["second"]
+    assert first["default_model"] == {"a": {}}
+    assert second["default_model"] == {}
+    assert first["worker_health_policy"] is not second["worker_health_policy"]
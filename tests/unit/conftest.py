@@ -34,11 +34,12 @@ def mock_run_keeper_dependencies() -> Generator[SimpleNamespace]:
     Yields a SimpleNamespace with mock objects that tests can customize:
       accessor, scheduler, db_manager, hcf, key_inventory_exporter.
 
-    Tests add file-specific patches (e.g., asyncio.sleep, get_collector)
-    on top of these common patches inside their own test functions.
+    Tests add file-specific patches (e.g., _wait_for_shutdown_signal,
+    get_collector) on top of these common patches inside their own test
+    functions.
 
-    Note: asyncio.sleep is NOT patched here — each file handles it
-    differently (KeyboardInterrupt vs. scheduler.start.side_effect).
+    Note: _wait_for_shutdown_signal is NOT patched here — each file handles
+    it differently (KeyboardInterrupt vs. scheduler.start.side_effect).
     """
     # --- Common mock objects ---
     mock_accessor = MagicMock()
@@ -146,6 +146,23 @@ def test_empty_enabled_providers_handling():
     assert len(enabled_providers) == 0
 
 
+def test_enabled_providers_snapshot_is_cached_per_accessor():
+    """get_enabled_providers() filters once and returns the same snapshot."""
+    config = Config()
+    config.providers = {
+        "on": ProviderConfig(enabled=True, provider_type="openai_like"),
+        "off": ProviderConfig(enabled=False, provider_type="openai_like"),
+    }
+    accessor = ConfigAccessor(config)
+
+    first = accessor.get_enabled_providers()
+    assert list(first) == ["on"]
+    assert accessor.get_enabled_providers() is first
+
+    # A reload builds a new accessor, which builds a fresh snapshot.
+    assert ConfigAccessor(config).get_enabled_providers() is not first
+
+
 # --- Tests for get_model_info and get_default_model_info ---
 
 
@@ -13,10 +13,12 @@ Covers test-plan scenarios:
   Section K: get_pool_health_summary
   Section L: max_concurrent_streams cap pass-through
   Section M: Per-provider dedicated client (no shared path)
+  Section N: min_keepalive_expiry floor
   Security:  SEC-4
 """
 
 import asyncio
+import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -982,3 +984,66 @@ class TestPerProviderDedicatedClient:
         assert "alpha" in factory._clients
         assert "beta" in factory._clients
         assert len(factory._clients) == 2
+
+
+class TestMinKeepaliveExpiry:
+    """Verify min_keepalive_expiry raises, but never lowers, keepalive_expiry."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("configured", "minimum", "expected"),
+        [(5.0, 90.0, 90.0), (120.0, 90.0, 120.0), (5.0, 0.0, 5.0)],
+    )
+    async def test_keepalive_expiry_floor(
+        self, configured: float, minimum: float, expected: float
+    ) -> None:
+        """The effective keepalive_expiry is max(configured, minimum)."""
+        provider = _make_provider_config(proxy_mode="none")
+        accessor = _make_accessor_mock(
+            providers={"test_prov": provider},
+            http_client_config=HttpClientConfig(
+                pool=HttpClientPoolConfig(keepalive_expiry=configured)
+            ),
+        )
+        factory = HttpClientFactory(accessor, min_keepalive_expiry=minimum)
+        mock_client = MagicMock(spec=httpx.AsyncClient)
+
+        captured_kwargs: dict[str, object] = {}
+
+        def capture_client(**kwargs: object) -> MagicMock:
+            captured_kwargs.update(kwargs)
+            return mock_client
+
+        with patch(
+            "src.core.http_client_factory.httpx.AsyncClient",
+            side_effect=capture_client,
+        ):
+            await factory.get_client_for_provider("test_prov")
+
+        limits = captured_kwargs["limits"]
+        assert isinstance(limits, httpx.Limits)
+        assert limits.keepalive_expiry == expected
+
+    @pytest.mark.parametrize(
+        ("configured", "minimum", "logged"),
+        [(5.0, 90.0, True), (120.0, 90.0, False)],
+    )
+    def test_raising_configured_value_is_logged(
+        self,
+        configured: float,
+        minimum: float,
+        logged: bool,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Overriding the configured keepalive_expiry is reported, not silent."""
+        accessor = _make_accessor_mock(
+            providers={},
+            http_client_config=HttpClientConfig(
+                pool=HttpClientPoolConfig(keepalive_expiry=configured)
+            ),
+        )
+        with caplog.at_level(logging.INFO, logger="src.core.http_client_factory"):
+            HttpClientFactory(accessor, min_keepalive_expiry=minimum)
+
+        raised = [r for r in caplog.records if "keepalive_expiry" in r.getMessage()]
+        assert bool(raised) is logged
@@ -50,6 +50,9 @@ async def test_init_db_pool_default_params():
         max_size=15,
         command_timeout=30.0,
         timeout=60.0,
+        max_inactive_connection_lifetime=300.0,
+        max_queries=50000,
+        statement_cache_size=1024,
     )
 
 
@@ -79,6 +82,9 @@ async def test_init_db_pool_custom_params():
         max_size=10,
         command_timeout=30.0,
         timeout=60.0,
+        max_inactive_connection_lifetime=300.0,
+        max_queries=50000,
+        statement_cache_size=1024,
     )
 
 
@@ -110,6 +116,9 @@ async def test_init_db_pool_forwards_timeout_param():
         max_size=15,
         command_timeout=60.0,
         timeout=10.0,
+        max_inactive_connection_lifetime=300.0,
+        max_queries=50000,
+        statement_cache_size=1024,
     )
 
 
@@ -152,4 +161,7 @@ async def test_init_db_pool_second_call_logs_warning():
             max_size=15,
             command_timeout=30.0,
             timeout=60.0,
+            max_inactive_connection_lifetime=300.0,
+            max_queries=50000,
+            statement_cache_size=1024,
         )
@@ -214,3 +214,33 @@ def test_sync_signature_no_provider_models_param():
     assert "provider_name" in param_names
     assert "provider_id" in param_names
     assert "keys_from_file" in param_names
+
+
+@pytest.mark.asyncio
+async def test_sync_removes_obsolete_rows_in_one_array_statement():
+    """Obsolete associations are deleted with one fixed statement taking
+    parallel key_id/model_name arrays, regardless of how many rows go."""
+    repo, mock_conn = _make_repo_and_conn()
+
+    mock_conn.fetch = AsyncMock(
+        side_effect=[
+            [{"id": 1, "key_value": "key1"}, {"id": 2, "key_value": "key2"}],
+            [{"id": 1}, {"id": 2}],
+            [
+                {"key_id": 1, "model_name": ALL_MODELS_MARKER},
+                {"key_id": 2, "model_name": ALL_MODELS_MARKER},
+                {"key_id": 1, "model_name": "model1"},
+                {"key_id": 2, "model_name": "model2"},
+            ],
+        ]
+    )
+
+    await repo.sync("test_provider", 10, {"key1", "key2"})
+
+    mock_conn.execute.assert_awaited_once()
+    query, key_ids, model_names = mock_conn.execute.call_args[0]
+    assert "UNNEST($1::int[], $2::text[])" in query
+    assert sorted(zip(key_ids, model_names, strict=True)) == [
+        (1, "model1"),
+        (2, "model2"),
+    ]
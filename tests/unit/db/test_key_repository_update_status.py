@@ -14,7 +14,7 @@ import pytest
 
 from src.core.constants import ALL_MODELS_MARKER, ErrorReason, Status
 from src.core.models import CheckResult
-from src.db.database import KeyRepository
+from src.db.database import _UPDATE_STATUS_QUERY, KeyRepository
 
 
 def _make_repo_and_conn() -> tuple[KeyRepository, MagicMock]:
@@ -180,3 +180,18 @@ async def test_update_status_with_untested_status():
 
     # result.ok is False → failing_since = COALESCE(failing_since, NOW())
     assert params[5] is False
+
+
+@pytest.mark.asyncio
+async def test_update_status_sends_module_level_query():
+    """update_status() sends the prebuilt UPDATE, filtered by key and model."""
+    repo, mock_conn = _make_repo_and_conn()
+
+    result = CheckResult.success(message="OK", response_time=10.0)
+    next_check_time = datetime(2025, 6, 1, 12, 0, 0, tzinfo=UTC)
+
+    await repo.update_status(1, "model1", "p", result, next_check_time)
+
+    sql = mock_conn.execute.call_args.args[0]
+    assert sql == _UPDATE_STATUS_QUERY
+    assert "WHERE key_id = $7 AND model_name = $8" in sql
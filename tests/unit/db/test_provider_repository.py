@@ -120,3 +120,50 @@ async def test_provider_sync_no_changes():
 
     mock_conn.copy_records_to_table.assert_not_called()
     mock_key_purger.purge_provider.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_id_map_is_served_from_sync_cache():
+    """After sync(), get_id_map() returns the cached map without a query."""
+    repo, mock_conn, _, mock_db_manager = _make_repo_and_deps(
+        db_rows=[{"name": "provider-a", "id": 1}, {"name": "stale", "id": 2}]
+    )
+
+    await repo.sync(["provider-a"], mock_db_manager)
+    mock_conn.fetch.reset_mock()
+
+    first = await repo.get_id_map()
+    first["mutated"] = 99
+    second = await repo.get_id_map()
+
+    assert second == {"provider-a": 1}
+    mock_conn.fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_id_map_rereads_ids_of_inserted_providers():
+    """New providers have no known id until the table is re-read in sync()."""
+    repo, mock_conn, _, mock_db_manager = _make_repo_and_deps()
+    mock_conn.fetch = AsyncMock(
+        side_effect=[
+            [{"name": "existing-provider", "id": 1}],
+            [{"name": "existing-provider", "id": 1}, {"name": "brand-new", "id": 7}],
+        ]
+    )
+
+    await repo.sync(["existing-provider", "brand-new"], mock_db_manager)
+
+    assert await repo.get_id_map() == {"existing-provider": 1, "brand-new": 7}
+    assert mock_conn.fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_id_map_queries_once_without_prior_sync():
+    """Without a sync, the first call loads the map and later calls reuse it."""
+    repo, mock_conn, _, _ = _make_repo_and_deps(
+        db_rows=[{"name": "provider-a", "id": 1}]
+    )
+
+    assert await repo.get_id_map() == {"provider-a": 1}
+    assert await repo.get_id_map() == {"provider-a": 1}
+    mock_conn.fetch.assert_awaited_once()
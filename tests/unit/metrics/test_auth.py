@@ -134,6 +134,24 @@ class TestValidateMetricsToken:
 
         assert result is None
 
+    def test_ma11a_non_ascii_token_raises_403(self) -> None:
+        """UT-MA11a: a non-ASCII raw_token is rejected with 403, not a TypeError from compare_digest."""
+        with pytest.raises(MetricsAuthError) as exc_info:
+            validate_metrics_token("t\u00f6ken", "correct_token")
+
+        assert exc_info.value.status_code == 403
+
+    def test_ma11b_comparison_is_constant_time(self) -> None:
+        """UT-MA11b: the token comparison goes through hmac.compare_digest."""
+        from unittest.mock import patch
+
+        with patch(
+            "src.metrics.auth.hmac.compare_digest", return_value=True
+        ) as mock_compare:
+            validate_metrics_token("a", "b")
+
+        mock_compare.assert_called_once_with(b"a", b"b")
+
     def test_ma12_bearer_prefix_token_raises_403(self) -> None:
         """UT-MA12: raw_token="Bearer correct_token", expected="correct_token" → raises MetricsAuthError(403) because validate_metrics_token receives a pre-extracted token."""
         with pytest.raises(MetricsAuthError) as exc_info:
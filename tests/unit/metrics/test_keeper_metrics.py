@@ -80,7 +80,7 @@ class TestKeeperCollectorInit:
                 new_callable=AsyncMock,
             ),
             patch(
-                "asyncio.sleep",
+                "src.services.keeper._wait_for_shutdown_signal",
                 new_callable=AsyncMock,
                 side_effect=KeyboardInterrupt,
             ),
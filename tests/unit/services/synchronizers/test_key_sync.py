@@ -252,6 +252,24 @@ def test_read_keys_ndjson_empty_line_skipped(tmp_path, caplog):
     assert "empty" not in caplog.text.lower()
 
 
+def test_read_keys_ndjson_crlf_line_endings(tmp_path):
+    """CRLF-terminated NDJSON lines are split the same way as LF lines."""
+    d = tmp_path / "keys"
+    d.mkdir()
+    (d / "keys.ndjson").write_bytes(b'{"value": "key1"}\r\n{"value": "key2"}\r\n')
+    keys, _ = read_keys_from_directory(str(d))
+    assert keys == {"key1", "key2"}
+
+
+def test_read_keys_ndjson_unicode_line_separator_not_split(tmp_path):
+    """A U+2028 inside a value does not split the NDJSON line."""
+    d = tmp_path / "keys"
+    d.mkdir()
+    (d / "keys.ndjson").write_text('{"value": "a\u2028b"}\n', encoding="utf-8")
+    keys, _ = read_keys_from_directory(str(d))
+    assert keys == {"a\u2028b"}
+
+
 def test_read_keys_ndjson_malformed_json_skipped(tmp_path, caplog):
     """Non-JSON line is logged as warning and skipped; valid lines processed."""
     d = tmp_path / "keys"
@@ -797,3 +815,59 @@ async def test_cleanup_after_sync_only_on_successful_sync(tmp_path):
         mock_unlink.assert_not_called()
         # File should still exist on disk
         assert os.path.exists(filepath)
+
+
+def test_read_keys_from_directory_path_is_a_file(tmp_path, caplog):
+    """A path that points at a regular file is treated as a missing directory."""
+    not_a_dir = tmp_path / "keys.txt"
+    not_a_dir.write_text("sk-a", encoding="utf-8")
+
+    keys, file_map = read_keys_from_directory(str(not_a_dir))
+
+    assert keys == set()
+    assert file_map == {}
+    assert "not a directory" in caplog.text.lower()
+
+
+def test_read_keys_from_directory_skips_subdirectories(tmp_path):
+    """Subdirectories (e.g. .trash/) are not read even if named like key files."""
+    d = tmp_path / "raw"
+    d.mkdir()
+    (d / "nested.txt").mkdir()
+    (d / "keys.txt").write_text("sk-top", encoding="utf-8")
+
+    keys, file_map = read_keys_from_directory(str(d))
+
+    assert keys == {"sk-top"}
+    assert list(file_map) == [os.path.abspath(d / "keys.txt")]
+
+
+def test_read_keys_from_directory_unchanged_files_not_reread(tmp_path):
+    """A second read of an unchanged directory reuses the previous result."""
+    d = tmp_path / "raw"
+    d.mkdir()
+    (d / "keys.txt").write_text("sk-a sk-b", encoding="utf-8")
+
+    first = read_keys_from_directory(str(d))
+    with patch.object(builtins, "open", side_effect=AssertionError("re-read")):
+        second = read_keys_from_directory(str(d))
+
+    assert second == first
+    assert second[0] is not first[0]
+
+
+def test_read_keys_from_directory_rereads_changed_file(tmp_path):
+    """A changed mtime or size invalidates the cached result."""
+    d = tmp_path / "raw"
+    d.mkdir()
+    keys_file = d / "keys.txt"
+    keys_file.write_text("sk-a", encoding="utf-8")
+    read_keys_from_directory(str(d))
+
+    keys_file.write_text("sk-a sk-new", encoding="utf-8")
+    stat = keys_file.stat()
+    os.utime(keys_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    keys, _ = read_keys_from_directory(str(d))
+
+    assert keys == {"sk-a", "sk-new"}
@@ -278,3 +278,49 @@ def test_get_key_from_pool_returns_none_when_empty():
     # Don't populate the pool at all
     result = cache.get_key_from_pool("nonexistent")
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_remove_key_from_pool_mutates_pool_in_place():
+    """Verify removal keeps the same deque object and preserves rotation order."""
+    cache = GatewayCache(MagicMock(), MagicMock())
+    pool = collections.deque([(10, "k10"), (42, "k42"), (99, "k99"), (42, "k42")])
+    cache._key_pool["my-provider"] = pool
+
+    await cache.remove_key_from_pool("my-provider", key_id=42)
+
+    assert cache._key_pool["my-provider"] is pool
+    assert list(pool) == [(10, "k10"), (99, "k99")]
+
+
+def test_gateway_cache_uses_slots():
+    """Verify GatewayCache has a fixed attribute layout without a __dict__."""
+    cache = GatewayCache(MagicMock(), MagicMock())
+
+    assert not hasattr(cache, "__dict__")
+    with pytest.raises(AttributeError):
+        cache.unexpected_attribute = 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_refresh_key_pool_logs_summary_after_releasing_lock():
+    """Verify the refresh summary is logged after the pool lock is released."""
+    mock_db_manager = MagicMock()
+    mock_db_manager.keys.get_all_valid_keys_for_caching = AsyncMock(
+        return_value=[
+            {"key_id": 1, "provider_name": "p", "model_name": "m", "key_value": "k"}
+        ]
+    )
+    cache = GatewayCache(MagicMock(), mock_db_manager)
+    lock_states: list[bool] = []
+
+    def record_lock_state(message: str) -> None:
+        if "refreshed successfully" in message:
+            lock_states.append(cache._refresh_lock.locked())
+
+    with patch("src.services.gateway.gateway_cache.logger") as mock_logger:
+        mock_logger.debug.side_effect = record_lock_state
+        await cache.refresh_key_pool()
+
+    assert lock_states == [False]
+    assert list(cache._key_pool["p"]) == [(1, "k")]
@@ -4,6 +4,9 @@ Unit tests for core gateway_service logic.
 Tests cover:
   1-5: _handle_full_stream_request / _handle_buffered_retryable_request
   6-8: Pool health log loop (_pool_health_log_loop)
+  8a: Failure task scheduling (_schedule_key_failure)
+  8b: Token extraction (_get_token_from_headers)
+  8c: Cache refresh loop scheduling (_cache_refresh_loop)
   9-11: create_app factory
   12-15: Static analysis / Pydantic validation (moved from integration)
 """
@@ -26,9 +29,12 @@ from src.core.constants import ErrorReason
 from src.core.models import CheckResult, RequestDetails
 from src.services.gateway.gateway_service import (
     GatewayStreamError,
+    _cache_refresh_loop,
+    _get_token_from_headers,
     _handle_buffered_retryable_request,
     _handle_full_stream_request,
     _pool_health_log_loop,
+    _schedule_key_failure,
     create_app,
 )
 
@@ -444,6 +450,180 @@ class TestBufferedRetryableRequest:
             request.app.state.gateway_cache.remove_key_from_pool.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# Test 8a: Failure task scheduling
+# ---------------------------------------------------------------------------
+
+
+class TestScheduleKeyFailure:
+    """Tests for _schedule_key_failure()."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_failure_task_registries(self):
+        """Isolate tests from the module-level task set and per-key report map."""
+        import src.services.gateway.gateway_service as gw_mod
+
+        gw_mod._pending_failure_tasks.clear()
+        gw_mod._key_report_tasks.clear()
+        yield
+        gw_mod._pending_failure_tasks.clear()
+        gw_mod._key_report_tasks.clear()
+
+    @pytest.mark.asyncio
+    async def test_tasks_are_tracked_until_done(self):
+        """Report and removal tasks are held strongly, then released."""
+        import src.services.gateway.gateway_service as gw_mod
+
+        cache = MagicMock()
+        cache.remove_key_from_pool = AsyncMock()
+        result = CheckResult.fail(ErrorReason.INVALID_KEY, "bad key")
+
+        with patch.object(gw_mod, "_report_key_failure", AsyncMock()) as report:
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", result)
+            assert len(gw_mod._pending_failure_tasks) == 2
+            await asyncio.gather(*gw_mod._pending_failure_tasks)
+
+        assert gw_mod._pending_failure_tasks == set()
+        report.assert_awaited_once()
+        cache.remove_key_from_pool.assert_awaited_once_with("p", 7)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_of_one_key_share_a_report(self):
+        """A second failure of a key whose report is in flight does not write again."""
+        import src.services.gateway.gateway_service as gw_mod
+
+        cache = MagicMock()
+        cache.remove_key_from_pool = AsyncMock()
+        result = CheckResult.fail(ErrorReason.RATE_LIMITED, "429")
+
+        with patch.object(gw_mod, "_report_key_failure", AsyncMock()) as report:
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", result)
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", result)
+            await asyncio.gather(*gw_mod._pending_failure_tasks)
+            assert report.await_count == 1
+            assert gw_mod._key_report_tasks == {}
+
+            # Once the first report is done, a new failure reports again.
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", result)
+            await asyncio.gather(*gw_mod._pending_failure_tasks)
+
+        assert report.await_count == 2
+        assert cache.remove_key_from_pool.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_with_different_reasons_both_report(self):
+        """A later failure with another reason is not folded into the in-flight one."""
+        import src.services.gateway.gateway_service as gw_mod
+
+        cache = MagicMock()
+        cache.remove_key_from_pool = AsyncMock()
+        rate_limited = CheckResult.fail(ErrorReason.RATE_LIMITED, "429")
+        invalid_key = CheckResult.fail(ErrorReason.INVALID_KEY, "bad key")
+
+        with patch.object(gw_mod, "_report_key_failure", AsyncMock()) as report:
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", rate_limited)
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", invalid_key)
+            await asyncio.gather(*gw_mod._pending_failure_tasks)
+
+        assert report.await_count == 2
+        reported = [c.args[3].error_reason for c in report.await_args_list]
+        assert reported == [ErrorReason.RATE_LIMITED, ErrorReason.INVALID_KEY]
+        assert gw_mod._key_report_tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_db_report_dropped_when_too_many_pending(self):
+        """Past the cap, the DB report is dropped but the key still leaves the pool."""
+        import src.services.gateway.gateway_service as gw_mod
+
+        cache = MagicMock()
+        cache.remove_key_from_pool = AsyncMock()
+        result = CheckResult.fail(ErrorReason.INVALID_KEY, "bad key")
+
+        with (
+            patch.object(gw_mod, "MAX_PENDING_FAILURE_TASKS", 0),
+            patch.object(gw_mod, "_report_key_failure", AsyncMock()) as report,
+        ):
+            _schedule_key_failure(MagicMock(), cache, MagicMock(), 7, "p", result)
+            await asyncio.gather(*gw_mod._pending_failure_tasks)
+
+        report.assert_not_called()
+        cache.remove_key_from_pool.assert_awaited_once_with("p", 7)
+
+
+# ---------------------------------------------------------------------------
+# Test 8b: Token extraction
+# ---------------------------------------------------------------------------
+
+
+class TestGetTokenFromHeaders:
+    """Tests for _get_token_from_headers()."""
+
+    @pytest.mark.parametrize(
+        "authorization, expected",
+        [
+            ("Bearer tok", "tok"),
+            ("bearer tok", "tok"),
+            ("BEARER tok", "tok"),
+            ("Basic tok", "fallback"),
+            ("Bearertok", "fallback"),
+            (None, "fallback"),
+        ],
+    )
+    def test_bearer_scheme_is_case_insensitive(self, authorization, expected):
+        """Only a case-insensitive 'bearer ' prefix selects the Authorization token."""
+        assert _get_token_from_headers(authorization, "fallback") == expected
+
+
+# ---------------------------------------------------------------------------
+# Test 8c: Cache refresh loop scheduling
+# ---------------------------------------------------------------------------
+
+
+class TestCacheRefreshLoop:
+    """Tests for _cache_refresh_loop() fixed-rate scheduling."""
+
+    @staticmethod
+    async def _run_loop(refresh_durations: list[float]) -> list[float]:
+        """Run the loop on a fake clock and return the requested sleep delays."""
+        clock = {"now": 0.0}
+        fake_loop = MagicMock()
+        fake_loop.time.side_effect = lambda: clock["now"]
+        durations = iter(refresh_durations)
+        delays: list[float] = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) > len(refresh_durations):
+                raise asyncio.CancelledError()
+            clock["now"] += delay
+
+        async def timed_refresh():
+            clock["now"] += next(durations)
+
+        cache = MagicMock()
+        cache.refresh_key_pool = AsyncMock(side_effect=timed_refresh)
+
+        with (
+            patch("asyncio.get_running_loop", return_value=fake_loop),
+            patch("asyncio.sleep", side_effect=fake_sleep),
+        ):
+            await _cache_refresh_loop(cache, interval_sec=10)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_refresh_duration_is_subtracted_from_next_sleep(self):
+        """A 3s refresh leaves a 7s sleep, keeping a 10s period."""
+        delays = await self._run_loop([3.0, 3.0, 3.0])
+        assert delays == [10.0, 7.0, 7.0, 7.0]
+
+    @pytest.mark.asyncio
+    async def test_long_overrun_resyncs_schedule(self):
+        """One refresh far over the interval does not queue catch-up runs."""
+        delays = await self._run_loop([35.0, 1.0, 1.0])
+        # Without the resync the loop would run 0s, 0s, 2s catch-up sleeps.
+        assert delays == [10.0, 0.0, 9.0, 9.0]
+
+
 # ---------------------------------------------------------------------------
 # Tests 9-11: Pool health log loop
 # ---------------------------------------------------------------------------
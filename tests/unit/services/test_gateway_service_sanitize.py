@@ -13,6 +13,7 @@ import pytest
 
 from src.core.constants import DebugMode
 from src.services.gateway.gateway_service import (
+    MAX_BINARY_DEBUG_BYTES,
     _log_debug_info,
     _sanitize_body,
     _sanitize_headers,
@@ -252,6 +253,14 @@ class TestSanitizeBody:
         result = _sanitize_body(body)
         assert result == repr(body)
 
+    def test_sanitize_body_large_invalid_utf8_is_capped(self):
+        """Large non-UTF-8 bodies render only a bounded repr prefix."""
+        body = b"\xff" * (MAX_BINARY_DEBUG_BYTES * 4)
+        result = _sanitize_body(body)
+        assert result.startswith(repr(body[:MAX_BINARY_DEBUG_BYTES]))
+        assert result.endswith(f"[truncated, {len(body)} bytes total]")
+        assert len(result) < len(repr(body)) // 3
+
     def test_sanitize_body_json_array(self):
         """JSON array should be processed."""
         body = b'[{"api_key": "secret"}]'
@@ -1,3 +1,6 @@
+import asyncio
+import signal
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,7 +13,7 @@ from src.config.schemas import (
 )
 from src.core.constants import ErrorReason
 from src.core.models import CheckResult
-from src.services.keeper import run_keeper
+from src.services.keeper import _wait_for_shutdown_signal, run_keeper
 from src.services.key_probe import KeyProbe
 
 
@@ -239,7 +242,11 @@ async def test_no_run_periodic_vacuum_job_registered(
 ) -> None:
     """M18: 'run_periodic_vacuum' is NOT in scheduler jobs after keeper setup."""
     deps = mock_run_keeper_dependencies
-    with patch("asyncio.sleep", new_callable=AsyncMock, side_effect=KeyboardInterrupt):
+    with patch(
+        "src.services.keeper._wait_for_shutdown_signal",
+        new_callable=AsyncMock,
+        side_effect=KeyboardInterrupt,
+    ):
         await run_keeper()
 
     # Verify no job with id "run_periodic_vacuum" was added
@@ -259,7 +266,11 @@ async def test_key_purge_cron_job_registered(
 ) -> None:
     """M19: Worker registers cron job 'key_purge' with day_of_week='sun', hour=4, minute=0."""
     deps = mock_run_keeper_dependencies
-    with patch("asyncio.sleep", new_callable=AsyncMock, side_effect=KeyboardInterrupt):
+    with patch(
+        "src.services.keeper._wait_for_shutdown_signal",
+        new_callable=AsyncMock,
+        side_effect=KeyboardInterrupt,
+    ):
         await run_keeper()
 
     # Find the key_purge job among add_job calls
@@ -285,7 +296,11 @@ async def test_smart_vacuum_interval_job_registered(
 ) -> None:
     """M20: Worker registers interval job 'smart_vacuum' with minutes=60."""
     deps = mock_run_keeper_dependencies
-    with patch("asyncio.sleep", new_callable=AsyncMock, side_effect=KeyboardInterrupt):
+    with patch(
+        "src.services.keeper._wait_for_shutdown_signal",
+        new_callable=AsyncMock,
+        side_effect=KeyboardInterrupt,
+    ):
         await run_keeper()
 
     # Find the smart_vacuum job among add_job calls
@@ -348,3 +363,224 @@ async def test_models_from_config_not_in_desired_state() -> None:
     assert "keys_from_files" in desired_state[provider_name]
     assert "file_map" in desired_state[provider_name]
     assert "models_from_config" not in desired_state[provider_name]
+
+
+# ---------------------------------------------------------------------------
+# Test: Phase 1 reads are dispatched concurrently and mapped back by provider
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_run_sync_cycle_reads_providers_via_to_thread() -> None:
+    """Each provider's key directory is read off-loop and mapped to its name."""
+    import asyncio
+    import os
+
+    from src.config.schemas import ProviderConfig
+    from src.services.keeper import run_sync_cycle
+
+    accessor = MagicMock()
+    accessor.get_enabled_providers.return_value = {
+        "alpha": ProviderConfig(provider_type="openai_like"),
+        "beta": ProviderConfig(provider_type="openai_like"),
+    }
+
+    db_manager = MagicMock()
+    db_manager.providers.get_id_map = AsyncMock(return_value={})
+
+    mock_syncer = MagicMock()
+    mock_syncer.get_resource_type.return_value = "keys"
+    mock_syncer.apply_state = AsyncMock()
+
+    def fake_read(path: str) -> tuple[set[str], dict[str, float]]:
+        return {f"key-{path}"}, {}
+
+    real_to_thread = asyncio.to_thread
+    with (
+        patch("src.services.keeper.read_keys_from_directory", side_effect=fake_read),
+        patch(
+            "src.services.keeper.asyncio.to_thread", side_effect=real_to_thread
+        ) as mock_to_thread,
+    ):
+        await run_sync_cycle(accessor, db_manager, [mock_syncer])
+
+    assert mock_to_thread.call_count == 2
+    _, desired_state = mock_syncer.apply_state.call_args[0]
+    for name in ("alpha", "beta"):
+        expected_path = os.path.join("data", name, "raw")
+        assert desired_state[name]["keys_from_files"] == {f"key-{expected_path}"}
+
+
+@pytest.mark.asyncio
+async def test_run_sync_cycle_failing_syncer_does_not_abort_others() -> None:
+    """A syncer raising in apply_state does not prevent the others from running."""
+    from src.services.keeper import run_sync_cycle
+
+    accessor = MagicMock()
+    accessor.get_enabled_providers.return_value = {}
+
+    db_manager = MagicMock()
+    db_manager.providers.get_id_map = AsyncMock(return_value={})
+
+    failing_syncer = MagicMock()
+    failing_syncer.get_resource_type.return_value = "keys"
+    failing_syncer.apply_state = AsyncMock(side_effect=RuntimeError("boom"))
+
+    healthy_syncer = MagicMock()
+    healthy_syncer.get_resource_type.return_value = "keys"
+    healthy_syncer.apply_state = AsyncMock()
+
+    await run_sync_cycle(accessor, db_manager, [failing_syncer, healthy_syncer])
+
+    failing_syncer.apply_state.assert_awaited_once()
+    healthy_syncer.apply_state.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_sync_cycle_fetches_id_map_alongside_reads() -> None:
+    """get_id_map() runs while the Phase 1 directory reads are still in flight."""
+    import threading
+
+    from src.config.schemas import ProviderConfig
+    from src.services.keeper import run_sync_cycle
+
+    accessor = MagicMock()
+    accessor.get_enabled_providers.return_value = {
+        "alpha": ProviderConfig(provider_type="openai_like"),
+    }
+
+    id_map_fetched = threading.Event()
+
+    async def fake_get_id_map() -> dict[str, int]:
+        id_map_fetched.set()
+        return {"alpha": 1}
+
+    db_manager = MagicMock()
+    db_manager.providers.get_id_map = fake_get_id_map
+
+    def fake_read(path: str) -> tuple[set[str], dict[str, float]]:
+        # Only succeeds if the ID map was requested before the read finished.
+        assert id_map_fetched.wait(timeout=5)
+        return {"sk-a"}, {}
+
+    mock_syncer = MagicMock()
+    mock_syncer.get_resource_type.return_value = "keys"
+    mock_syncer.apply_state = AsyncMock()
+
+    with patch("src.services.keeper.read_keys_from_directory", side_effect=fake_read):
+        await run_sync_cycle(accessor, db_manager, [mock_syncer])
+
+    provider_id_map, desired_state = mock_syncer.apply_state.call_args[0]
+    assert provider_id_map == {"alpha": 1}
+    assert desired_state["alpha"]["keys_from_files"] == {"sk-a"}
+
+
+@pytest.mark.asyncio
+async def test_interval_jobs_are_jittered_and_probe_starts_staggered(
+    mock_run_keeper_dependencies,
+) -> None:
+    """Probe jobs start 2s apart and interval jobs carry jitter."""
+    deps = mock_run_keeper_dependencies
+    probes = [MagicMock(), MagicMock()]
+    with (
+        patch("src.services.keeper.get_all_probes", return_value=probes),
+        patch(
+            "src.services.keeper._wait_for_shutdown_signal",
+            new_callable=AsyncMock,
+            side_effect=KeyboardInterrupt,
+        ),
+    ):
+        await run_keeper()
+
+    jobs = {c.kwargs["id"]: c.kwargs for c in deps.scheduler.add_job.call_args_list}
+    probe_jobs = [jobs["MagicMock_cycle_0"], jobs["MagicMock_cycle_1"]]
+
+    assert all(job["jitter"] == 15 for job in probe_jobs)
+    assert probe_jobs[1]["start_date"] - probe_jobs[0]["start_date"] == timedelta(
+        seconds=2
+    )
+    assert jobs["two_phase_sync_cycle"]["jitter"] == 60
+
+
+@pytest.mark.asyncio
+async def test_cycle_jobs_coalesce_with_misfire_grace(
+    mock_run_keeper_dependencies,
+) -> None:
+    """Probe and sync jobs never overlap and tolerate late starts."""
+    deps = mock_run_keeper_dependencies
+    with (
+        patch("src.services.keeper.get_all_probes", return_value=[MagicMock()]),
+        patch(
+            "src.services.keeper._wait_for_shutdown_signal",
+            new_callable=AsyncMock,
+            side_effect=KeyboardInterrupt,
+        ),
+    ):
+        await run_keeper()
+
+    jobs = {c.kwargs["id"]: c.kwargs for c in deps.scheduler.add_job.call_args_list}
+    for job_id, grace in (("MagicMock_cycle_0", 30), ("two_phase_sync_cycle", 120)):
+        assert jobs[job_id]["coalesce"] is True
+        assert jobs[job_id]["max_instances"] == 1
+        assert jobs[job_id]["misfire_grace_time"] == grace
+
+
+@pytest.mark.asyncio
+async def test_wait_for_shutdown_signal_returns_on_sigterm() -> None:
+    """SIGTERM wakes the keeper immediately and the handlers are removed."""
+    loop = asyncio.get_running_loop()
+    waiter = asyncio.create_task(_wait_for_shutdown_signal())
+    await asyncio.sleep(0)
+
+    signal.raise_signal(signal.SIGTERM)
+    await asyncio.wait_for(waiter, timeout=1)
+
+    assert loop.remove_signal_handler(signal.SIGTERM) is False
+    assert loop.remove_signal_handler(signal.SIGINT) is False
+
+
+@pytest.mark.asyncio
+async def test_directory_setup_failure_waits_for_pool_init(
+    mock_run_keeper_dependencies,
+) -> None:
+    """Directory setup and pool init run together; a setup error is only
+    raised once the pool init has finished, and startup stops there."""
+    deps = mock_run_keeper_dependencies
+    with (
+        patch(
+            "src.services.keeper._setup_directories",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("disk full"),
+        ),
+        patch(
+            "src.services.keeper.database.init_db_pool", new_callable=AsyncMock
+        ) as mock_init_pool,
+    ):
+        await run_keeper()
+
+    mock_init_pool.assert_awaited_once()
+    deps.db_manager.initialize_schema.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_connection_error_reuses_loaded_accessor(
+    mock_run_keeper_dependencies, capsys
+) -> None:
+    """The DB connection error report uses the accessor built at startup
+    instead of loading the config file a second time."""
+    deps = mock_run_keeper_dependencies
+    deps.accessor.get_database_config.return_value = MagicMock(
+        host="db.internal", port=5433
+    )
+    with (
+        patch(
+            "src.services.keeper.database.init_db_pool",
+            new_callable=AsyncMock,
+            side_effect=ConnectionRefusedError("refused"),
+        ),
+        patch("src.services.keeper.load_config") as mock_load_config,
+    ):
+        await run_keeper()
+
+    mock_load_config.assert_called_once()
+    assert "db.internal:5433" in capsys.readouterr().out
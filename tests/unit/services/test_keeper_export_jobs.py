@@ -63,7 +63,7 @@ async def _run_keeper_capture_scheduler(
         min_size=1, max_size=5
     )
 
-    # Break the infinite sleep loop by raising at scheduler.start()
+    # Stop the keeper before it waits for a shutdown signal
     deps.scheduler.start.side_effect = KeyboardInterrupt
 
     # Set up exporter mock (file-specific, not in common fixture)
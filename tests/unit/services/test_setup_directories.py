@@ -1,72 +1,92 @@
 """Tests for _setup_directories in keeper.py — basic, proxy-absence, and cleanup scenarios."""
 
 import logging
+import os
 from unittest.mock import MagicMock, patch
 
-from src.services.keeper import _setup_directories
+import pytest
+
+from src.config.schemas import Config, ProviderConfig
+from src.core.accessor import ConfigAccessor
+from src.services.keeper import _mkdir_batch, _setup_directories
 
 
 class TestSetupDirectories:
     """Basic tests for _setup_directories."""
 
-    def test_setup_directories_creates_data_name_raw(self):
+    @pytest.mark.asyncio
+    async def test_setup_directories_creates_data_name_raw(self):
         """_setup_directories creates data/<name>/raw for enabled providers."""
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
         with patch("src.services.keeper.os.makedirs") as patched_makedirs:
-            _setup_directories(mock_accessor)
+            await _setup_directories(mock_accessor)
             patched_makedirs.assert_any_call("data/test-provider/raw", exist_ok=True)
 
-    def test_setup_directories_existing_directory_no_error(self):
+    @pytest.mark.asyncio
+    async def test_setup_directories_existing_directory_no_error(self):
         """Existing directory does not raise error (exist_ok=True)."""
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
         with patch("src.services.keeper.os.makedirs") as mock_makedirs:
-            _setup_directories(mock_accessor)
+            await _setup_directories(mock_accessor)
 
         # Should still be called with exist_ok=True
         call_kwargs = mock_makedirs.call_args[1]
         assert call_kwargs["exist_ok"] is True
 
-    def test_setup_directories_does_not_use_keys_path(self):
+    @pytest.mark.asyncio
+    async def test_setup_directories_does_not_use_keys_path(self):
         """_setup_directories does not access provider.keys_path."""
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
         with patch("src.services.keeper.os.makedirs"):
-            _setup_directories(mock_accessor)
+            await _setup_directories(mock_accessor)
 
         # provider.keys_path should never be accessed
         # Since it's a MagicMock, any attribute access returns another MagicMock
         # We just verify the path was computed correctly
         assert True  # No exception means no keys_path access attempted
 
-    def test_setup_directories_skips_disabled_providers(self):
+    @pytest.mark.asyncio
+    async def test_setup_directories_skips_disabled_providers(self):
         """Disabled providers do not get directories created."""
-        mock_accessor = MagicMock()
-        mock_provider = MagicMock()
-        mock_provider.enabled = False
-        mock_accessor.get_all_providers.return_value = {
-            "disabled-provider": mock_provider
+        config = Config()
+        config.providers = {
+            "disabled-provider": ProviderConfig(
+                enabled=False, provider_type="openai_like"
+            ),
+            "enabled-provider": ProviderConfig(
+                enabled=True, provider_type="openai_like"
+            ),
         }
+        accessor = ConfigAccessor(config)
 
         with patch("src.services.keeper.os.makedirs") as mock_makedirs:
-            _setup_directories(mock_accessor)
+            await _setup_directories(accessor)
 
-        # No makedirs should be called for disabled providers
-        # (should not have been called with any data/ path for this provider)
+        # Only the enabled provider's data/ path is requested
         for call in mock_makedirs.call_args_list:
             assert "disabled-provider" not in str(call)
+        mock_makedirs.assert_any_call("data/enabled-provider/raw", exist_ok=True)
 
-    def test_setup_directories_no_makedirs_for_pool_list_path(self):
+    @pytest.mark.asyncio
+    async def test_setup_directories_no_makedirs_for_pool_list_path(self):
         """_setup_directories does NOT call makedirs for pool_list_path
         even when provider has ProxyConfig(mode='static').
 
@@ -77,7 +97,9 @@ class TestSetupDirectories:
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"my-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "my-provider": mock_provider
+        }
         # Simulate a provider with static proxy config — no pool_list_path
         # should be created by _setup_directories
         mock_proxy_config = MagicMock()
@@ -86,7 +108,7 @@ class TestSetupDirectories:
         mock_accessor.get_proxy_config.return_value = mock_proxy_config
 
         with patch("src.services.keeper.os.makedirs") as mock_makedirs:
-            _setup_directories(mock_accessor)
+            await _setup_directories(mock_accessor)
 
             # Only data/<name>/raw should be created — no pool_list_path directories
             for call in mock_makedirs.call_args_list:
@@ -103,7 +125,8 @@ class TestSetupDirectories:
 class TestSetupDirectoriesCleanup:
     """Tests for _setup_directories trash cleanup (Group 7)."""
 
-    def test_setup_directories_cleans_trash_with_leftover_files(
+    @pytest.mark.asyncio
+    async def test_setup_directories_cleans_trash_with_leftover_files(
         self, tmp_path, monkeypatch, caplog
     ):
         """raw/.trash/ has leftover files, all deleted and dir removed."""
@@ -123,15 +146,18 @@ class TestSetupDirectoriesCleanup:
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
-        _setup_directories(mock_accessor)
+        await _setup_directories(mock_accessor)
 
         # All files inside .trash/ should be gone and the directory itself removed
         assert not trash_dir.exists()
         assert "removed leftover .trash/" in caplog.text
 
-    def test_setup_directories_no_trash_dir_no_error(
+    @pytest.mark.asyncio
+    async def test_setup_directories_no_trash_dir_no_error(
         self, tmp_path, monkeypatch, caplog
     ):
         """raw/.trash/ doesn't exist, no error."""
@@ -146,14 +172,17 @@ class TestSetupDirectoriesCleanup:
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
-        _setup_directories(mock_accessor)
+        await _setup_directories(mock_accessor)
 
         # No error raised and no cleanup log message
         assert "removed leftover .trash/" not in caplog.text
 
-    def test_setup_directories_trash_cleanup_for_each_provider(
+    @pytest.mark.asyncio
+    async def test_setup_directories_trash_cleanup_for_each_provider(
         self, tmp_path, monkeypatch, caplog
     ):
         """Multiple providers with .trash/, cleanup for each."""
@@ -176,9 +205,9 @@ class TestSetupDirectoriesCleanup:
             providers[name] = mock_provider
 
         mock_accessor = MagicMock()
-        mock_accessor.get_all_providers.return_value = providers
+        mock_accessor.get_enabled_providers.return_value = providers
 
-        _setup_directories(mock_accessor)
+        await _setup_directories(mock_accessor)
 
         # Verify all .trash/ directories are gone
         for name in ("provider-a", "provider-b", "provider-c"):
@@ -189,7 +218,8 @@ class TestSetupDirectoriesCleanup:
         for name in ("provider-a", "provider-b", "provider-c"):
             assert name in caplog.text
 
-    def test_setup_directories_trash_cleanup_preserves_raw_files(
+    @pytest.mark.asyncio
+    async def test_setup_directories_trash_cleanup_preserves_raw_files(
         self, tmp_path, monkeypatch, caplog
     ):
         """Only .trash/ removed, normal raw files preserved."""
@@ -209,9 +239,11 @@ class TestSetupDirectoriesCleanup:
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
-        _setup_directories(mock_accessor)
+        await _setup_directories(mock_accessor)
 
         # .trash/ should be gone
         assert not trash_dir.exists()
@@ -219,7 +251,8 @@ class TestSetupDirectoriesCleanup:
         assert (raw_dir / "key1.txt").exists()
         assert (raw_dir / "key2.ndjson").exists()
 
-    def test_setup_directories_trash_cleanup_empty_trash_dir(
+    @pytest.mark.asyncio
+    async def test_setup_directories_trash_cleanup_empty_trash_dir(
         self, tmp_path, monkeypatch, caplog
     ):
         """.trash/ exists but empty, directory removed."""
@@ -237,11 +270,75 @@ class TestSetupDirectoriesCleanup:
         mock_accessor = MagicMock()
         mock_provider = MagicMock()
         mock_provider.enabled = True
-        mock_accessor.get_all_providers.return_value = {"test-provider": mock_provider}
+        mock_accessor.get_enabled_providers.return_value = {
+            "test-provider": mock_provider
+        }
 
-        _setup_directories(mock_accessor)
+        await _setup_directories(mock_accessor)
 
         # .trash/ should be removed even though it was empty
         assert not trash_dir.exists()
         # Cleanup should be logged
         assert "removed leftover .trash/" in caplog.text
+
+
+class TestMkdirBatch:
+    """Tests for the _mkdir_batch helper used by _setup_directories."""
+
+    def test_mkdir_batch_skips_ancestors_of_created_paths(self):
+        """An ancestor of another requested path is not passed to makedirs."""
+        paths = {"data/p/raw", "data/p", "data/q/raw", ""}
+
+        with patch("src.services.keeper.os.makedirs") as mock_makedirs:
+            _mkdir_batch(paths)
+
+        created = sorted(call[0][0] for call in mock_makedirs.call_args_list)
+        assert created == ["data/p/raw", "data/q/raw"]
+
+    def test_mkdir_batch_creates_nested_directories(self, tmp_path):
+        """Deep paths are created on disk including their parents."""
+        target = tmp_path / "data" / "provider" / "raw"
+
+        _mkdir_batch({str(target), str(target.parent)})
+
+        assert target.is_dir()
+
+    def test_mkdir_batch_does_not_makedirs_existing_directories(self, tmp_path):
+        """Directories that already exist are only checked, not re-created."""
+        existing = tmp_path / "data" / "p" / "raw"
+        existing.mkdir(parents=True)
+        missing = tmp_path / "data" / "q" / "raw"
+
+        with patch(
+            "src.services.keeper.os.makedirs", wraps=os.makedirs
+        ) as mock_makedirs:
+            _mkdir_batch({str(existing), str(missing)})
+
+        requested = {call.args[0] for call in mock_makedirs.call_args_list}
+        assert str(missing) in requested
+        assert str(existing) not in requested
+        assert missing.is_dir()
+
+    def test_mkdir_batch_single_mkdir_when_parent_exists(self, tmp_path):
+        """A leaf whose parent exists is created with one os.mkdir call."""
+        (tmp_path / "data").mkdir()
+        target = tmp_path / "data" / "raw"
+
+        with (
+            patch("src.services.keeper.os.mkdir", wraps=os.mkdir) as mock_mkdir,
+            patch("src.services.keeper.os.makedirs") as mock_makedirs,
+        ):
+            _mkdir_batch({str(target)})
+            _mkdir_batch({str(target)})
+
+        assert mock_mkdir.call_count == 2
+        mock_makedirs.assert_not_called()
+        assert target.is_dir()
+
+    def test_mkdir_batch_raises_when_path_is_a_file(self, tmp_path):
+        """A regular file where a directory is expected is not accepted."""
+        target = tmp_path / "raw"
+        target.write_text("")
+
+        with pytest.raises(FileExistsError):
+            _mkdir_batch({str(target)})